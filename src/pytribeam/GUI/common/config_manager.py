@@ -24,6 +24,7 @@ class AppConfig:
         auto_save_interval: Seconds between auto-saves (0 to disable)
         recent_configs: List of recently opened config files
         max_recent_files: Maximum number of recent files to track
+        max_terminal_lines: Maximum number of lines kept in the GUI terminal
     """
 
     data_dir: Path
@@ -32,6 +33,7 @@ class AppConfig:
     auto_save_interval: int = 300  # seconds
     recent_configs: List[str] = field(default_factory=list)
     max_recent_files: int = 10
+    max_terminal_lines: int = 10000
 
     @classmethod
     def from_env(cls, app_name: str = "pytribeam") -> "AppConfig":
@@ -90,6 +92,7 @@ class AppConfig:
             auto_save_interval=data.get("auto_save_interval", 300),
             recent_configs=data.get("recent_configs", []),
             max_recent_files=data.get("max_recent_files", 10),
+            max_terminal_lines=data.get("max_terminal_lines", 10000),
         )
 
     def save_to_file(self, config_file: Path):
@@ -109,6 +112,7 @@ class AppConfig:
             "auto_save_interval": self.auto_save_interval,
             "recent_configs": self.recent_configs,
             "max_recent_files": self.max_recent_files,
+            "max_terminal_lines": self.max_terminal_lines,
         }
 
         with open(config_file, "w") as f:
@@ -152,21 +156,27 @@ class AppConfig:
     def get_terminal_log_path(self) -> Path:
         """Get path for new terminal log file.
 
+        The log directory is created if it doesn't exist yet.
+
         Returns:
             Path for terminal log file with timestamp
         """
         import time
 
+        self.log_dir.mkdir(parents=True, exist_ok=True)
         timestamp = time.strftime("%Y%m%d-%H%M%S")
         return self.log_dir / f"{timestamp}_terminal.txt"
 
     def get_error_log_path(self) -> Path:
         """Get path for new error traceback file.
 
+        The log directory is created if it doesn't exist yet.
+
         Returns:
             Path for error log file with timestamp
         """
         import time
 
+        self.log_dir.mkdir(parents=True, exist_ok=True)
         timestamp = time.strftime("%Y%m%d-%H%M%S")
         return self.log_dir / f"{timestamp}_error_traceback.txt"
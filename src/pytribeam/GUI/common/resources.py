@@ -4,6 +4,7 @@ This module provides centralized management of application resources like
 images, icons, and documentation files.
 """
 
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, Dict, List
 
@@ -47,28 +48,33 @@ class AppResources:
         module_path = Path(module_file)
         # module.py -> GUI -> pytribeam -> src -> pytribeam_root
         if module_path.parent.name == "GUI":
-            base = module_path.parent.parent.parent.parent
+            base = module_path.parents[3]
         elif (
             module_path.parent.name == "common"
             or module_path.parent.name == "config_ui"
         ):
-            base = module_path.parent.parent.parent.parent.parent
+            base = module_path.parents[4]
         return cls(base_path=base)
 
-    @property
+    @cached_property
+    def logos_dir(self) -> Path:
+        """Directory holding the logo and icon images."""
+        return self.base_path / "docs/userguide/src/logos"
+
+    @cached_property
     def icon_path(self) -> Path:
         """Path to application icon (.ico file)."""
-        return self.base_path / "docs/userguide/src/logos/logo_color_alt.ico"
+        return self.logos_dir / "logo_color_alt.ico"
 
-    @property
+    @cached_property
     def logo_dark_path(self) -> Path:
         """Path to dark theme logo image."""
-        return self.base_path / "docs/userguide/src/logos/logo_color_dark.png"
+        return self.logos_dir / "logo_color_dark.png"
 
-    @property
+    @cached_property
     def logo_light_path(self) -> Path:
         """Path to light theme logo image."""
-        return self.base_path / "docs/userguide/src/logos/logo_color.png"
+        return self.logos_dir / "logo_color.png"
 
     @property
     def user_guide_path(self) -> Path:
@@ -6,10 +6,14 @@ and Windows-specific keyboard event generation for emergency stops.
 
 import ctypes
 import inspect
+import os
+import queue
+import sys
 import threading
 import time
-from collections import namedtuple
+from collections import deque
 from ctypes import wintypes
+from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Tuple
 
 
@@ -76,21 +80,14 @@ class StoppableThread(threading.Thread):
 
         Raises:
             threading.ThreadError: If thread is not active
-            AssertionError: If thread ID cannot be determined
         """
         if not self.is_alive():
             raise threading.ThreadError("the thread is not active")
 
-        if self._thread_id is not None:
-            return self._thread_id
-
-        # Look for thread in _active dict
-        for tid, tobj in threading._active.items():
-            if tobj is self:
-                self._thread_id = tid
-                return tid
-
-        raise AssertionError("could not determine the thread's id")
+        if self._thread_id is None:
+            # The same id PyThreadState_SetAsyncExc expects (not native_id)
+            self._thread_id = self.ident
+        return self._thread_id
 
     def raise_exception(self, exc_type: type):
         """Raise exception in the context of this thread.
@@ -232,28 +229,63 @@ class TextRedirector:
 
     This allows capturing print statements and displaying them in the GUI
     while optionally logging to a file. Thread-safe for use with background threads.
+
+    Writes from background threads are queued and inserted into the widget
+    together, in a single call scheduled on the main thread once it is idle,
+    rather than one widget update per write.
+
+    The log file is written by its own thread, so a write only has to queue
+    the text. Call ``flush`` to wait until everything written so far is in
+    the file.
     """
 
-    def __init__(self, widget, tag: str = "stdout", log_path: Optional[str] = None):
+    # Longest time flush() waits for the log file to catch up
+    FLUSH_TIMEOUT_S = 5.0
+
+    def __init__(
+        self,
+        widget,
+        tag: str = "stdout",
+        log_path: Optional[str] = None,
+        max_lines: Optional[int] = None,
+    ):
         """Initialize text redirector.
 
         Args:
             widget: Tkinter Text widget to write to
             tag: Tag for text styling (e.g., 'stdout', 'stderr')
             log_path: Optional file path to also log output
+            max_lines: Optional number of lines to keep in the widget, older
+                lines are removed from the top (the log file keeps everything)
         """
         self.widget = widget
         self.tag = tag
         self.log_path = log_path
+        self.max_lines = max_lines
         self._main_thread_id = threading.current_thread().ident
+        self._pending = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._log_fd: Optional[int] = None
+        self._log_queue = None
+        self._log_thread = None
+        # Guards the log queue, so nothing is queued after close()
+        self._log_lock = threading.Lock()
 
         if self.log_path is not None:
-            import os
-
-            if not os.path.exists(self.log_path):
-                os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
-                with open(self.log_path, "w") as f:
+            log_file = Path(self.log_path)
+            if not log_file.exists():
+                log_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(log_file, "w") as f:
                     f.write(time.strftime("%Y-%m-%d %H:%M:%S") + "\n")
+            self._log_queue = queue.SimpleQueue()
+            self._log_thread = threading.Thread(
+                target=self._write_log,
+                args=(self._log_queue,),
+                name="TerminalLogThread",
+                daemon=True,
+            )
+            self._log_thread.start()
 
     def write(self, text: str):
         """Write text to widget and optional log file.
@@ -263,34 +295,57 @@ class TextRedirector:
         """
         import tkinter as tk
 
-        # Write to log file FIRST to ensure it always happens
+        # Queue for the log file FIRST to ensure it always happens
         # even if widget access fails
-        if self.log_path is not None:
-            try:
-                with open(self.log_path, "a") as f:
-                    f.write(text)
-            except Exception:
-                # Ignore file write errors to avoid breaking stdout
-                pass
+        with self._log_lock:
+            if self._log_queue is not None:
+                self._log_queue.put(text)
 
         # Write to widget using thread-safe approach
-        # If we're on the main thread, write directly
-        # If we're on a background thread, schedule on main thread
+        # If we're on the main thread, write directly (after anything still
+        # queued, to keep the order)
+        # If we're on a background thread, queue the text for the main thread
         if threading.current_thread().ident == self._main_thread_id:
+            with self._pending_lock:
+                if self._pending:
+                    self._pending.append(text)
+                    text = "".join(self._pending)
+                    self._pending.clear()
+            # Show it right away, the main thread may be about to block
+            self._write_to_widget(text, redraw=True)
+            return
+
+        with self._pending_lock:
+            self._pending.append(text)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        # Schedule one widget update for everything queued until it runs
+        try:
+            self.widget.after_idle(self._flush)
+        except Exception:
+            # If after_idle() fails (widget destroyed), fall back to direct write
+            self._flush()
+
+    def _flush(self):
+        """Write all queued text to the widget in one go.
+
+        Runs from after_idle, when Tk redraws the widget next anyway.
+        """
+        with self._pending_lock:
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+        if text:
             self._write_to_widget(text)
-        else:
-            # Schedule widget update on main thread using after()
-            try:
-                self.widget.after(0, self._write_to_widget, text)
-            except Exception:
-                # If after() fails (widget destroyed), fall back to direct write
-                self._write_to_widget(text)
 
-    def _write_to_widget(self, text: str):
+    def _write_to_widget(self, text: str, redraw: bool = False):
         """Internal method to write text to widget.
 
         Args:
             text: Text to write
+            redraw: Whether to redraw the widget now instead of leaving it to
+                the Tk event loop
         """
         import tkinter as tk
 
@@ -304,14 +359,16 @@ class TextRedirector:
             # Write to widget
             self.widget.config(state=tk.NORMAL)
             self.widget.insert(tk.END, text, (self.tag,))
+            if self.max_lines is not None:
+                self._trim_widget()
             self.widget.config(state=tk.DISABLED)
 
             # Autoscroll if at bottom
             if autoscroll and bottom == 1:
                 self.widget.see(tk.END)
 
-            # Force GUI update to show text immediately
-            self.widget.update_idletasks()
+            if redraw:
+                self.widget.update_idletasks()
         except tk.TclError:
             # Widget may have been destroyed or is not accessible
             # This can happen when writing from a background thread
@@ -321,156 +378,267 @@ class TextRedirector:
             # breaking stdout/stderr redirection
             pass
 
-    def flush(self):
-        """Flush output (required for file-like interface)."""
-        pass
+    def _trim_widget(self):
+        """Remove the oldest lines from the widget to keep at most max_lines."""
+        line_count = int(self.widget.index("end-1c").split(".")[0])
+        excess = line_count - self.max_lines
+        if excess > 0:
+            self.widget.delete("1.0", f"{excess}.0")
 
+    def _write_log(self, log_queue: queue.SimpleQueue):
+        """Write queued text to the log file until the redirector is closed.
 
-def generate_escape_keypress():
-    """Generate escape keypress for Windows microscope control.
+        Runs on the log thread. Whatever has been queued by the time the
+        thread wakes up is written and flushed together. The queue also
+        carries events, set once the text queued before them is written, and
+        None, which closes the file and ends the thread.
 
-    This function finds the microscope control window and sends escape
-    and F6 key presses to stop ongoing operations.
+        Args:
+            log_queue: Queue filled by write, flush and close
+        """
+        while True:
+            items = [log_queue.get()]
+            try:
+                while True:
+                    items.append(log_queue.get_nowait())
+            except queue.Empty:
+                pass
+            chunks = []
+            for item in items:
+                if isinstance(item, str):
+                    chunks.append(item)
+                    continue
+                self._append_to_log("".join(chunks))
+                chunks = []
+                if item is None:
+                    self._close_log_file()
+                    return
+                item.set()
+            self._append_to_log("".join(chunks))
+
+    def _append_to_log(self, text: str):
+        """Append text to the log file, keeping it open between writes.
+
+        The text is written straight to the file descriptor, without Python's
+        buffering, so the log stays complete if the app is killed.
 
-    Note: This is Windows-specific and uses ctypes to interact with Win32 API.
+        Args:
+            text: Text to append
+        """
+        if not text:
+            return
+        try:
+            if self._log_fd is None:
+                self._log_fd = os.open(
+                    self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                )
+            data = memoryview(text.encode("utf-8", "replace"))
+            while data:
+                data = data[os.write(self._log_fd, data) :]
+        except Exception:
+            # Ignore file write errors to avoid breaking stdout
+            pass
 
-    Raises:
-        OSError: If on non-Windows platform
-    """
-    import sys
+    def _close_log_file(self):
+        """Close the log file, if it was opened."""
+        if self._log_fd is not None:
+            try:
+                os.close(self._log_fd)
+            except OSError:
+                pass
+            self._log_fd = None
 
-    if sys.platform != "win32":
-        raise OSError("generate_escape_keypress only works on Windows")
+    def flush(self):
+        """Wait until everything written so far is in the log file.
 
-    user32 = ctypes.WinDLL("user32", use_last_error=True)
+        Gives up after FLUSH_TIMEOUT_S, so a stuck log thread cannot block
+        the caller.
+        """
+        written = threading.Event()
+        with self._log_lock:
+            log_queue = self._log_queue
+            if log_queue is None:
+                return
+            log_queue.put(written)
+        written.wait(timeout=self.FLUSH_TIMEOUT_S)
+
+    def close(self):
+        """Write what is left to the log file, then close it.
+
+        Text written after this is only shown in the widget.
+        """
+        with self._log_lock:
+            log_queue = self._log_queue
+            log_thread = self._log_thread
+            self._log_queue = None
+            self._log_thread = None
+        if log_queue is None:
+            return
+        log_queue.put(None)
+        log_thread.join()
+
+
+# Win32 keyboard input, used by generate_escape_keypress
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_MAPVK_VK_TO_VSC = 0
+_VK_ESC = 0x1B
+_VK_F6 = 0x75
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = (
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", wintypes.WPARAM),
+    )
 
-    # Window enumeration setup
-    def check_zero(result, func, args):
-        if not result:
-            err = ctypes.get_last_error()
-            if err:
-                raise ctypes.WinError(err)
-        return args
 
-    if not hasattr(wintypes, "LPDWORD"):
-        wintypes.LPDWORD = ctypes.POINTER(wintypes.DWORD)
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = (
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", wintypes.WPARAM),
+    )
 
-    WindowInfo = namedtuple("WindowInfo", "pid title")
 
-    WNDENUMPROC = ctypes.WINFUNCTYPE(
-        wintypes.BOOL,
-        wintypes.HWND,
-        wintypes.LPARAM,
+class _HARDWAREINPUT(ctypes.Structure):
+    _fields_ = (
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
     )
 
-    user32.EnumWindows.errcheck = check_zero
-    user32.EnumWindows.argtypes = (WNDENUMPROC, wintypes.LPARAM)
-    user32.IsWindowVisible.argtypes = (wintypes.HWND,)
-    user32.GetWindowThreadProcessId.restype = wintypes.DWORD
-    user32.GetWindowThreadProcessId.argtypes = (wintypes.HWND, wintypes.LPDWORD)
-    user32.GetWindowTextLengthW.errcheck = check_zero
-    user32.GetWindowTextLengthW.argtypes = (wintypes.HWND,)
-    user32.GetWindowTextW.errcheck = check_zero
-    user32.GetWindowTextW.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
 
-    # Enumerate windows
-    result = []
+class _INPUT(ctypes.Structure):
+    class _INPUT_UNION(ctypes.Union):
+        _fields_ = (("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT), ("hi", _HARDWAREINPUT))
 
-    @WNDENUMPROC
-    def enum_proc(hWnd, lParam):
-        if user32.IsWindowVisible(hWnd):
-            pid = wintypes.DWORD()
-            user32.GetWindowThreadProcessId(hWnd, ctypes.byref(pid))
-            length = user32.GetWindowTextLengthW(hWnd) + 1
-            title = ctypes.create_unicode_buffer(length)
-            user32.GetWindowTextW(hWnd, title, length)
-            result.append(WindowInfo(pid.value, title.value))
-        return True
+    _anonymous_ = ("_input",)
+    _fields_ = (("type", wintypes.DWORD), ("_input", _INPUT_UNION))
 
-    user32.EnumWindows(enum_proc, 0)
 
-    # Input simulation setup
-    INPUT_KEYBOARD = 1
-    KEYEVENTF_KEYUP = 0x0002
-    KEYEVENTF_UNICODE = 0x0004
-    MAPVK_VK_TO_VSC = 0
+# Handle of the microscope control window, found by generate_escape_keypress
+_microscope_window = None
+# Key events sent by generate_escape_keypress, built on first use
+_escape_inputs = None
 
-    wintypes.ULONG_PTR = wintypes.WPARAM
 
-    class MOUSEINPUT(ctypes.Structure):
-        _fields_ = (
-            ("dx", wintypes.LONG),
-            ("dy", wintypes.LONG),
-            ("mouseData", wintypes.DWORD),
-            ("dwFlags", wintypes.DWORD),
-            ("time", wintypes.DWORD),
-            ("dwExtraInfo", wintypes.ULONG_PTR),
-        )
+def _check_zero(result, func, args):
+    """ctypes errcheck raising the last Win32 error, if any, when a call returns 0."""
+    if not result:
+        err = ctypes.get_last_error()
+        if err:
+            raise ctypes.WinError(err)
+    return args
 
-    class KEYBDINPUT(ctypes.Structure):
-        _fields_ = (
-            ("wVk", wintypes.WORD),
-            ("wScan", wintypes.WORD),
-            ("dwFlags", wintypes.DWORD),
-            ("time", wintypes.DWORD),
-            ("dwExtraInfo", wintypes.ULONG_PTR),
-        )
 
-        def __init__(self, *args, **kwds):
-            super(KEYBDINPUT, self).__init__(*args, **kwds)
-            if not self.dwFlags & KEYEVENTF_UNICODE:
-                self.wScan = user32.MapVirtualKeyExW(self.wVk, MAPVK_VK_TO_VSC, 0)
+def _check_count(result, func, args):
+    """ctypes errcheck raising the last Win32 error if no input was sent."""
+    if result == 0:
+        raise ctypes.WinError(ctypes.get_last_error())
+    return args
 
-    class HARDWAREINPUT(ctypes.Structure):
-        _fields_ = (
-            ("uMsg", wintypes.DWORD),
-            ("wParamL", wintypes.WORD),
-            ("wParamH", wintypes.WORD),
-        )
 
-    class INPUT(ctypes.Structure):
-        class _INPUT(ctypes.Union):
-            _fields_ = (("ki", KEYBDINPUT), ("mi", MOUSEINPUT), ("hi", HARDWAREINPUT))
+# user32 bindings used by generate_escape_keypress, set up once at import
+if sys.platform == "win32":
+    _WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
 
-        _anonymous_ = ("_input",)
-        _fields_ = (("type", wintypes.DWORD), ("_input", _INPUT))
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    # EnumWindows is not error-checked: it also returns 0 when the callback
+    # stops it early on finding the window
+    _user32.EnumWindows.argtypes = (_WNDENUMPROC, wintypes.LPARAM)
+    _user32.IsWindow.argtypes = (wintypes.HWND,)
+    _user32.IsWindowVisible.argtypes = (wintypes.HWND,)
+    _user32.GetWindowTextLengthW.errcheck = _check_zero
+    _user32.GetWindowTextLengthW.argtypes = (wintypes.HWND,)
+    _user32.GetWindowTextW.errcheck = _check_zero
+    _user32.GetWindowTextW.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+    _user32.SendInput.errcheck = _check_count
+    _user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
 
-    LPINPUT = ctypes.POINTER(INPUT)
 
-    def _check_count(result, func, args):
-        if result == 0:
-            raise ctypes.WinError(ctypes.get_last_error())
-        return args
+def _find_microscope_window() -> Optional[int]:
+    """Return the handle of the first visible "Microscope Control" window, if any."""
+    found = []
 
-    user32.SendInput.errcheck = _check_count
-    user32.SendInput.argtypes = (wintypes.UINT, LPINPUT, ctypes.c_int)
+    @_WNDENUMPROC
+    def enum_proc(hWnd, lParam):
+        if _user32.IsWindowVisible(hWnd):
+            length = _user32.GetWindowTextLengthW(hWnd) + 1
+            title = ctypes.create_unicode_buffer(length)
+            _user32.GetWindowTextW(hWnd, title, length)
+            if "Microscope Control" in title.value:
+                found.append(hWnd)
+                # Stop enumerating at the first match
+                return False
+        return True
 
-    def press_key(hex_key_code):
-        """Press a key."""
-        x = INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=hex_key_code))
-        user32.SendInput(1, ctypes.byref(x), ctypes.sizeof(x))
+    _user32.EnumWindows(enum_proc, 0)
+    return found[0] if found else None
 
-    def release_key(hex_key_code):
-        """Release a key."""
-        x = INPUT(
-            type=INPUT_KEYBOARD,
-            ki=KEYBDINPUT(wVk=hex_key_code, dwFlags=KEYEVENTF_KEYUP),
-        )
-        user32.SendInput(1, ctypes.byref(x), ctypes.sizeof(x))
-
-    # Find and activate microscope window
-    VK_ESC = 0x1B
-    VK_F6 = 0x75
-    VKs = [VK_ESC, VK_F6, VK_F6]
-
-    for window_info in result:
-        if "Microscope Control" in window_info.title:
-            window = user32.FindWindowW(None, window_info.title)
-            if window:
-                user32.ShowWindow(window, 9)  # SW_RESTORE
-                user32.SetForegroundWindow(window)
-                for vk in VKs:
-                    press_key(vk)
-                    time.sleep(0.05)
-                    release_key(vk)
-                break
+
+def generate_escape_keypress():
+    """Generate escape keypress for Windows microscope control.
+
+    This function finds the microscope control window and sends escape
+    and F6 key presses to stop ongoing operations.
+
+    Note: This is Windows-specific and uses ctypes to interact with Win32 API.
+
+    Raises:
+        OSError: If on non-Windows platform
+    """
+    if sys.platform != "win32":
+        raise OSError("generate_escape_keypress only works on Windows")
+
+    # Reuse the window found last time, as long as it is still open
+    global _microscope_window
+    window = _microscope_window
+    if not (window and _user32.IsWindow(window)):
+        window = _find_microscope_window()
+        _microscope_window = window
+
+    # Key events are built once, scan codes included, and reused
+    global _escape_inputs
+    if _escape_inputs is None:
+        _escape_inputs = _build_key_inputs(_user32, (_VK_ESC, _VK_F6, _VK_F6))
+
+    if window:
+        _user32.ShowWindow(window, 9)  # SW_RESTORE
+        _user32.SetForegroundWindow(window)
+        input_size = ctypes.sizeof(_INPUT)
+        for k in range(0, len(_escape_inputs), 2):
+            # Press, then release the key
+            _user32.SendInput(1, ctypes.byref(_escape_inputs[k]), input_size)
+            time.sleep(0.05)
+            _user32.SendInput(1, ctypes.byref(_escape_inputs[k + 1]), input_size)
+
+
+def _build_key_inputs(user32, vks: Tuple[int, ...]) -> ctypes.Array:
+    """Return press and release keyboard events for each virtual key, in order.
+
+    Args:
+        user32: The loaded user32 library
+        vks: Virtual key codes
+
+    Returns:
+        Array of 2 INPUT structures per key, the press followed by the release
+    """
+    inputs = (_INPUT * (2 * len(vks)))()
+    scan_codes = {}
+    for k, vk in enumerate(vks):
+        if vk not in scan_codes:
+            scan_codes[vk] = user32.MapVirtualKeyExW(vk, _MAPVK_VK_TO_VSC, 0)
+        press, release = inputs[2 * k], inputs[2 * k + 1]
+        for event, flags in ((press, 0), (release, _KEYEVENTF_KEYUP)):
+            event.type = _INPUT_KEYBOARD
+            event.ki.wVk = vk
+            event.ki.wScan = scan_codes[vk]
+            event.ki.dwFlags = flags
+    return inputs
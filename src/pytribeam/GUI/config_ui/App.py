@@ -1,5 +1,4 @@
 from pathlib import Path
-from copy import deepcopy
 import tkinter as tk
 from tkinter import messagebox
 
@@ -1109,8 +1108,7 @@ class Configurator:
         ### entries = lut.LUT[step_type]
         ### entries_flat = flatten_dict(entries, sep="/")
         entries = lut.get_lut(step_type, float(self.yml_version.get()))
-        entries_flat = deepcopy(entries)
-        entries_flat.flatten()
+        entries_flat = entries.view(flat=True)
         ##### End changes
         depth = max([len(k.split("/")) for k in entries_flat.keys()])
         # If depth is one, then we have no subframes and we just populate the editor
@@ -1194,16 +1192,17 @@ class Configurator:
         )
 
         # Create the widgets and place them on the grid
-        kwargs = deepcopy(value.widget_kwargs)
+        kwargs = dict(value.widget_kwargs)
         kwargs.update({"font": ctk.FONT, "bg": self.theme.bg_off})
-        if value.widget == ctk.Entry:
+        widget_cls = value.widget_cls
+        if widget_cls == ctk.Entry:
             kwargs.update({"disabledbackground": self.theme.bg_off})
-        elif value.widget == ctk.MenuButton:
+        elif widget_cls == ctk.MenuButton:
             kwargs.update({"h_bg": self.theme.accent1, "h_fg": self.theme.accent1_fg})
         label = ctk.AutofitLabel(
             frame, text=value.label, font=ctk.FONT, bg=self.theme.bg, fg=self.theme.fg
         )
-        widget = value.widget(
+        widget = widget_cls(
             frame,
             var=var,
             **kwargs,
@@ -1,63 +1,122 @@
-from typing import Any, Dict, NamedTuple, Optional, Type, Union
-from copy import deepcopy
-import tkinter as tk
-import pytribeam.GUI.CustomTkinterWidgets as ctk
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+from enum import Enum
+import functools
+import sys
+from types import MappingProxyType
 
 from pytribeam import types as tbt
 from pytribeam import utilities as ut
 
+if TYPE_CHECKING:
+    import tkinter as tk
 
-VERSIONS = [version.version for version in tbt.YMLFormatVersion]
 
-# Import options from types
-beam_types = [i.value for i in tbt.BeamType]
-wavelengths = [i.value for i in tbt.LaserWavelength]
-polarizations = [i.value for i in tbt.LaserPolarization]
-coordinate_refs = [i.value for i in tbt.CoordinateReference]
-laser_scan_types_box = [i.value for i in tbt.LaserScanType]
-laser_scan_types_line = [i.value for i in tbt.LaserScanType]
-laser_pattern_modes = [i.value for i in tbt.LaserPatternMode]
-detector_types = [i.value for i in tbt.DetectorType]
-detector_modes = [i.value for i in tbt.DetectorMode]
-resolutions = [i.value for i in tbt.PresetResolution]
-fib_scan_dirs = [i.value for i in tbt.FIBPatternScanDirection]
-fib_scan_types = [i.value for i in tbt.FIBPatternScanType]
-bit_depths = [i.value for i in tbt.ColorDepth]
-rotation_sides = [i.value for i in tbt.RotationSide]
-
-# Options need empty values
-beam_types.append("")
-wavelengths.append("")
-coordinate_refs.append("")
-laser_scan_types_box.append("")
-laser_scan_types_line.append("")
-laser_pattern_modes.append("")
-detector_types.append("")
-detector_modes.append("")
-resolutions.append("WIDTHxHEIGHT")
-fib_scan_dirs.append("")
-fib_scan_types.append("")
-rotation_sides.append("")
+VERSIONS = [version.version for version in tbt.YMLFormatVersion]
+MAX_VERSION = max(VERSIONS)
+# Version limit of the fields available from the first config version onward
+_LIMIT_V1_0 = tbt.Limit(min=1.0, max=MAX_VERSION)
+# Widget kwargs shared by the boolean check buttons
+_CHECKBUTTON_KWARGS = MappingProxyType(
+    {"offvalue": False, "onvalue": True, "bd": 0, "dtype": bool}
+)
+_DISABLED_CHECKBUTTON_KWARGS = MappingProxyType(
+    {**_CHECKBUTTON_KWARGS, "state": "disabled"}
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_values(enum: Type[Enum], trailing: Optional[str] = None) -> Tuple[Any, ...]:
+    """Return the values of an enumerated type, with an optional trailing option (e.g. an empty value)."""
+    values = tuple(member.value for member in enum)
+    if trailing is not None:
+        values += (trailing,)
+    return values
+
+
+@functools.lru_cache(maxsize=None)
+def _build_options() -> Dict[str, Tuple[Any, ...]]:
+    """Build the widget option lists from the enumerated types. Done once, on first use."""
+    # Options need empty values, except where noted
+    return {
+        "beam_types": _enum_values(tbt.BeamType, ""),
+        "wavelengths": _enum_values(tbt.LaserWavelength, ""),
+        "polarizations": _enum_values(tbt.LaserPolarization),
+        "coordinate_refs": _enum_values(tbt.CoordinateReference, ""),
+        "laser_scan_types_box": _enum_values(tbt.LaserScanType, ""),
+        "laser_scan_types_line": _enum_values(tbt.LaserScanType, ""),
+        "laser_pattern_modes": _enum_values(tbt.LaserPatternMode, ""),
+        "detector_types": _enum_values(tbt.DetectorType, ""),
+        "detector_modes": _enum_values(tbt.DetectorMode, ""),
+        "resolutions": _enum_values(tbt.PresetResolution, "WIDTHxHEIGHT"),
+        "fib_scan_dirs": _enum_values(tbt.FIBPatternScanDirection, ""),
+        "fib_scan_types": _enum_values(tbt.FIBPatternScanType, ""),
+        "bit_depths": _enum_values(tbt.ColorDepth),
+        "rotation_sides": _enum_values(tbt.RotationSide, ""),
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_path(path: str, separator: str) -> Tuple[str, ...]:
+    """Split a flattened LUT path into its components. The paths are the same
+    every time a LUT is unflattened, so the result is cached."""
+    return tuple(path.split(separator))
 
 
 class LUTField(NamedTuple):
-    """Represents a single field in the LUT with both GUI and type information"""
+    """Represents a single field in the LUT with both GUI and type information.
+
+    Fields are immutable (and, as a named tuple, carry no per-instance __dict__),
+    so the same instance is shared between LUTs and their clones. The
+    widget_kwargs mapping is shared as well; fields created by this module hold a
+    read-only view of it, with any options as tuples, so copy it before use.
+
+    The widget is normally the name of a class in CustomTkinterWidgets, so that
+    the LUTs can be used without importing tkinter; use widget_cls to get the
+    class itself.
+    """
 
     label: str
     default: Any
-    widget: Type[tk.Widget]
-    widget_kwargs: Dict[str, Any]
+    widget: Union[str, Type["tk.Widget"]]
+    widget_kwargs: Mapping[str, Any]
     help_text: str
     dtype: Type
     version: tbt.Limit
 
+    @property
+    def widget_cls(self) -> Type["tk.Widget"]:
+        """The widget class, importing the widgets on first use if needed."""
+        if isinstance(self.widget, str):
+            return getattr(_widgets(), self.widget)
+        return self.widget
+
 
 class LUT:
     """Base class for type-aware lookup tables"""
 
+    __slots__ = ("_entries", "name", "_flat_cache")
+
+    # Incremented on every change to any LUT. Cached flattened forms are only
+    # reused while this is unchanged, which also covers changes made to nested
+    # LUTs (that have no reference to their parents).
+    _mutations = 0
+
     def __init__(self, name: Optional[str] = None):
         self._entries = {}
         self.name = name
+        self._flat_cache = None
 
     def __repr__(self):
         return f"LUT({self.name})"
@@ -70,14 +129,21 @@ class LUT:
         return self.get_entry(key)
 
     def __setitem__(self, key: str, value: Union[LUTField, "LUT"]):
-        self.add_entry(key, value)
+        """Set an entry, replacing any existing entry with the same name."""
+        LUT._mutations += 1
+        self._entries[key] = value
 
     def __eq__(self, other: "LUT") -> bool:
         """Compare two TypedLUTs for equality"""
+        if self is other:
+            return True
         if not isinstance(other, LUT):
             return False
 
-        # Compare flattened versions to check structure and content
+        # Compare flattened versions to check structure and content. The number
+        # of top level entries can't be used as a shortcut, since a flattened
+        # LUT is equal to its nested form (the flattened dicts compare lengths
+        # first anyway).
         this = self._flatten()
         that = other._flatten()
         return this == that
@@ -92,55 +158,135 @@ class LUT:
         return self._entries.items()
 
     def add_entry(self, name: str, field: Union[LUTField, "LUT"]):
+        """Add a new entry. Use item assignment to replace an existing one."""
+        if name in self._entries:
+            raise ValueError(f"Entry '{name}' already exists in {self!r}")
+        LUT._mutations += 1
         self._entries[name] = field
 
+    def extend(self, entries: Iterable[Tuple[str, Union[LUTField, "LUT"]]]):
+        """Add several new (name, entry) pairs at once."""
+        new_entries = {}
+        for name, entry in entries:
+            if name in self._entries or name in new_entries:
+                raise ValueError(f"Entry '{name}' already exists in {self!r}")
+            new_entries[name] = entry
+        LUT._mutations += 1
+        self._entries.update(new_entries)
+
     def get_entry(self, name: str) -> LUTField:
         return self._entries[name]
 
     def remove_entry(self, name: str):
+        LUT._mutations += 1
         return self._entries.pop(name)
 
+    def remove_leaf(self, path: Tuple[str, ...]) -> Union[LUTField, "LUT"]:
+        """Remove and return the entry at ``path`` (a tuple of names) in place."""
+        node = self
+        for name in path[:-1]:
+            node = node._entries[name]
+        LUT._mutations += 1
+        return node._entries.pop(path[-1])
+
+    def set_path(self, path: Tuple[str, ...], entry: Union[LUTField, "LUT"]):
+        """Set the entry at ``path`` (a tuple of names) without affecting other
+        LUTs. Nested LUTs may be shared between several LUTs, so each one along
+        the path is copied (shallowly) before it is changed."""
+        LUT._mutations += 1
+        node = self
+        for name in path[:-1]:
+            child = node._entries[name]
+            copy = LUT(child.name)
+            copy._entries = dict(child._entries)
+            node._entries[name] = copy
+            node = copy
+        node._entries[path[-1]] = entry
+
+    def clone(self) -> "LUT":
+        """Copy the structure of the LUT. Nested LUTs are copied, while the
+        (immutable) LUTFields are shared with the original."""
+        new = LUT(self.name)
+        for name, entry in self._entries.items():
+            new._entries[name] = entry.clone() if type(entry) is LUT else entry
+        return new
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "LUT":
+        """Deep copies only need new nested LUTs, so this is the same as clone."""
+        new = memo[id(self)] = self.clone()
+        return new
+
     def _prune_empty(self) -> bool:
         """
         Recursively remove empty nested LUTs.
         Returns True if this node is empty after pruning.
         """
-        to_delete = []
-
-        for name, entry in self._entries.items():
-            if isinstance(entry, LUT):
-                if entry._prune_empty():
-                    to_delete.append(name)
-
-        for name in to_delete:
-            del self._entries[name]
+        # Single pass over the entries, only replacing them if something was pruned
+        pruned = {
+            name: entry
+            for name, entry in self._entries.items()
+            if type(entry) is not LUT or not entry._prune_empty()
+        }
+        if len(pruned) != len(self._entries):
+            LUT._mutations += 1
+            self._entries = pruned
 
         return len(self._entries) == 0
 
     def flatten(self, separator: str = "/") -> Dict[str, LUTField]:
         """Flatten the LUT into a dictionary of fields with paths as keys."""
-        self._entries = self._flatten(separator=separator)
+        LUT._mutations += 1
+        self._entries = dict(self._flatten(separator=separator))
 
     def _flatten(self, separator: str = "/", prefix: str = ""):
-        """Flattens the fields using a separator. This is done in place."""
-        flattened = {}
+        """Return the fields keyed by their paths, joined with the separator.
+        The LUT itself is left as is. The result is a cached mapping, shared
+        until a LUT is modified, so it is read-only and must not be changed."""
+        cache_key = (separator, prefix, LUT._mutations)
+        if self._flat_cache is not None and self._flat_cache[0] == cache_key:
+            return self._flat_cache[1]
 
-        for name, entry in self._entries.items():
-            current_path = f"{prefix}{name}" if prefix else name
+        flattened = {}
 
-            if isinstance(entry, LUTField):
+        # Walk the tree depth first with an explicit stack of iterators so the
+        # flattened keys keep the same order as the nested entries.
+        stack = [(prefix, iter(self._entries.items()))]
+        while stack:
+            path_prefix, entries = stack[-1]
+            for name, entry in entries:
+                current_path = f"{path_prefix}{name}"
+                # LUT is not subclassed, and anything that isn't a LUT is a field
+                if type(entry) is LUT:
+                    stack.append(
+                        (f"{current_path}{separator}", iter(entry._entries.items()))
+                    )
+                    break
                 flattened[current_path] = entry
-            elif isinstance(entry, LUT):
-                # Recursively flatten nested LUT
-                nested_flat = entry._flatten(
-                    separator=separator, prefix=f"{current_path}{separator}"
-                )
-                flattened.update(nested_flat)
+            else:
+                stack.pop()
 
+        self._flat_cache = (cache_key, flattened)
         return flattened
 
+    def iter_leaves(self) -> Iterator[Tuple[Tuple[str, ...], LUTField]]:
+        """Yield ``(path, field)`` for every field in the LUT, in the same order
+        as flatten, with the path as a tuple of names. The LUT must not be
+        changed while iterating."""
+        stack = [((), iter(self._entries.items()))]
+        while stack:
+            path_prefix, entries = stack[-1]
+            for name, entry in entries:
+                path = path_prefix + (name,)
+                if type(entry) is LUT:
+                    stack.append((path, iter(entry._entries.items())))
+                    break
+                yield path, entry
+            else:
+                stack.pop()
+
     def unflatten(self, separator: str = "/") -> "LUT":
         """Reconstruct a TypedLUT from a flattened dictionary."""
+        LUT._mutations += 1
         self._entries = self._unflatten(self._entries, separator=separator)._entries
 
     @classmethod
@@ -155,19 +301,27 @@ class LUT:
             TypedLUT: Reconstructed hierarchical structure
         """
         root = cls()
+        # Nested LUTs keyed by their path, so siblings share the lookup of their
+        # parent instead of walking down from the root each time.
+        nodes = {(): root}
 
         for path, field in flat_dict.items():
             # Split path into components
-            parts = path.split(separator)
-
-            # Start at root
-            current = root
-
-            # Create/traverse path
-            for i, part in enumerate(parts[:-1]):  # All but last component
-                if part not in current._entries:
-                    current._entries[part] = cls(name=part)
-                current = current._entries[part]
+            parts = _split_path(path, separator)
+            parent_parts = parts[:-1]
+
+            current = nodes.get(parent_parts)
+            if current is None:
+                # Create/traverse path
+                current = root
+                for depth, part in enumerate(parent_parts, start=1):
+                    node = nodes.get(parent_parts[:depth])
+                    if node is None:
+                        node = current._entries.get(part)
+                        if node is None:
+                            node = current._entries[part] = cls(name=part)
+                        nodes[parent_parts[:depth]] = node
+                    current = node
 
             # Add the field at the final location
             current._entries[parts[-1]] = field
@@ -175,1148 +329,1380 @@ class LUT:
         return root
 
     @property
-    def entries(self) -> Dict[str, LUTField]:
-        return self._entries
-
-
-### General LUT ###
-slice_thickness_um = LUTField(
-    "Slice Thickness (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "Thickness of the laser cut slice in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-max_slice_num = LUTField(
-    "Max Slice Number",
-    "",
-    ctk.Entry,
-    {"dtype": int},
-    "The maximum slice number to cut. The experiment will stop after this slice number is complete.",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-pre_tilt_deg = LUTField(
-    "Pre-Tilt Angle (deg)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The angle to pre-tilt sample holder used. This angle impacts how stage movements are determined.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-sectioning_axis = LUTField(
-    "Sectioning Axis",
-    "Z",
-    ctk.MenuButton,
-    {"options": ["X", "Y", "Z"], "dtype": str, "state": "disabled"},
-    "The axis that the laser will cut along. Can be X, Y, or Z.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-stage_translational_tol_um = LUTField(
-    "Stage Translational Tolerance (um)",
-    0.5,
-    ctk.Entry,
-    {"dtype": float},
-    "The tolerance for translational stage movements in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-stage_angular_tol_deg = LUTField(
-    "Stage Angular Tolerance (deg)",
-    0.02,
-    ctk.Entry,
-    {"dtype": float},
-    "The tolerance for angular stage movements in degrees.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-connection_host = LUTField(
-    "Connection Host",
-    "localhost",
-    ctk.Entry,
-    {"dtype": str},
-    "The host of the connection to the SEM.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-connection_port = LUTField(
-    "Connection Port",
-    "",
-    ctk.Entry,
-    {"dtype": int},
-    "The port of the connection to the SEM.",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-ebsd_oem = LUTField(
-    "EBSD OEM",
-    "",
-    ctk.MenuButton,
-    {"options": ["EDAX", "Oxford", "null"], "dtype": str},
-    "The OEM of the EBSD system being used.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-eds_oem = LUTField(
-    "EDS OEM",
-    "",
-    ctk.MenuButton,
-    {"options": ["EDAX", "Oxford", "null"], "dtype": str},
-    "The OEM of the EDS system being used.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-exp_dir = LUTField(
-    "Experiment Directory",
-    "./",
-    ctk.PathEntry,
-    {"directory": True},
-    "The directory where the experiment data is saved.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-h5_log_name = LUTField(
-    "H5 Log Name",
-    "log",
-    ctk.Entry,
-    {"dtype": str},
-    "The name of the HDF5 log file.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-step_count = LUTField(
-    "Step Count",
-    0,
-    ctk.Entry,
-    {"dtype": int},
-    "The number of steps in the experiment.",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-general_lut = LUT("general")
-general_lut.add_entry("slice_thickness_um", deepcopy(slice_thickness_um))
-general_lut.add_entry("max_slice_num", deepcopy(max_slice_num))
-general_lut.add_entry("pre_tilt_deg", deepcopy(pre_tilt_deg))
-general_lut.add_entry("sectioning_axis", deepcopy(sectioning_axis))
-general_lut.add_entry(
-    "stage_translational_tol_um", deepcopy(stage_translational_tol_um)
-)
-general_lut.add_entry("stage_angular_tol_deg", deepcopy(stage_angular_tol_deg))
-general_lut.add_entry("connection_host", deepcopy(connection_host))
-general_lut.add_entry("connection_port", deepcopy(connection_port))
-general_lut.add_entry("EBSD_OEM", deepcopy(ebsd_oem))
-general_lut.add_entry("EDS_OEM", deepcopy(eds_oem))
-general_lut.add_entry("exp_dir", deepcopy(exp_dir))
-general_lut.add_entry("h5_log_name", deepcopy(h5_log_name))
-general_lut.add_entry("step_count", deepcopy(step_count))
-
-### STAGE ###
-x_mm = LUTField(
-    "Start X Position (mm)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The starting X position of the laser cut.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-y_mm = LUTField(
-    "Start Y Position (mm)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The starting Y position of the laser cut.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-z_mm = LUTField(
-    "Start Z Position (mm)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The starting Z position of the laser cut.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-t_deg = LUTField(
-    "Start T Position (°)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The starting T position of the laser cut.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-r_deg = LUTField(
-    "Start R Position (°)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The starting R position of the laser cut.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-rotation_side = LUTField(
-    "Rotation Side",
-    rotation_sides[-1],
-    ctk.MenuButton,
-    {"options": rotation_sides, "dtype": str},
-    "Whether the sample pretilt is in the laser position or the FIB position.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-initial_pos_lut = LUT("initial_position")
-initial_pos_lut.add_entry("x_mm", x_mm)
-initial_pos_lut.add_entry("y_mm", y_mm)
-initial_pos_lut.add_entry("z_mm", z_mm)
-initial_pos_lut.add_entry("t_deg", t_deg)
-initial_pos_lut.add_entry("r_deg", r_deg)
-stage_lut = LUT("stage")
-stage_lut.add_entry("rotation_side", rotation_side)
-stage_lut.add_entry("initial_position", initial_pos_lut)
-
-### COMMON ###
-step_name = LUTField(
-    "Step Name",
-    "",
-    ctk.Entry,
-    {"dtype": str},
-    "The name of the step.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-step_number = LUTField(
-    "Step Number",
-    "",
-    ctk.Entry,
-    {"state": "disabled", "dtype": int},
-    "The number of the step in the sequence of steps.",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-step_type = LUTField(
-    "Step Type",
-    "",
-    ctk.Entry,
-    {"state": "disabled", "dtype": str},
-    "The step type.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-frequency = LUTField(
-    "Frequency",
-    1,
-    ctk.Entry,
-    {"dtype": int},
-    "The frequency that this step is activated (i.e. 1 means every slice, 2 means every other slice, etc.).",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-common_lut = LUT("stage")
-common_lut.add_entry("step_name", step_name)
-common_lut.add_entry("step_number", step_number)
-common_lut.add_entry("step_type", step_type)
-common_lut.add_entry("frequency", frequency)
-common_lut.add_entry("stage", stage_lut)
-
-### AUTO_CB ###
-left = LUTField(
-    "Left Fraction",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "Fractional position (of the entire image) for the left edge of the reduced area for auto contrast and brightness adjustment. Empty/None/null for all fractions turns off ACB.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-width = LUTField(
-    "Width Fraction",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The fractional width (of the entire image) to use for auto contrast and brightness. Empty/None for all fractions turns off ACB.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-top = LUTField(
-    "Top Fraction",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "Fractional position (of the entire image) for the top edge of the reduced area for auto contrast and brightness adjustment. Empty/None for all fractions turns off ACB.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-height = LUTField(
-    "Height Fraction",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The fractional height (of the entire image) to use for auto contrast and brightness. Empty/None for all fractions turns off ACB.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-auto_cb_lut = LUT("auto_cb")
-auto_cb_lut.add_entry("left", left)
-auto_cb_lut.add_entry("width", width)
-auto_cb_lut.add_entry("top", top)
-auto_cb_lut.add_entry("height", height)
-
-### BEAM ###
-beam_type = LUTField(
-    "Beam Type",
-    beam_types[-1],
-    ctk.MenuButton,
-    {"options": beam_types, "dtype": str},
-    "The type of beam used to acquire the image.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-voltage_kv = LUTField(
-    "Beam Voltage (kV)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The voltage of the beam in keV.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-voltage_tol_kv = LUTField(
-    "Beam Voltage Tolerance (kV)",
-    0.1,
-    ctk.Entry,
-    {"dtype": float},
-    "The tolerance of the beam voltage in kV.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-current_na = LUTField(
-    "Beam Current (nA)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The current of the beam in nA.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-current_tol_na = LUTField(
-    "Beam Current Tolerance (nA)",
-    0.5,
-    ctk.Entry,
-    {"dtype": float},
-    "The tolerance of the beam current in nA.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-hfw_mm = LUTField(
-    "Horizontal Field Width (mm)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The horizontal field width of the image in mm.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-working_dist_mm = LUTField(
-    "Working Distance (mm)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The working distance of the image in mm.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-dynamic_focus = LUTField(
-    "Use Dynamic Focus",
-    False,
-    ctk.Checkbutton,
-    {"offvalue": False, "onvalue": True, "bd": 0, "dtype": bool},
-    "Whether to use dynamic focusing.",
-    bool,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-tilt_correction = LUTField(
-    "Use Tilt Correction",
-    False,
-    ctk.Checkbutton,
-    {"offvalue": False, "onvalue": True, "bd": 0, "dtype": bool},
-    "Whether to use tilt correction.",
-    bool,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-beam_lut = LUT("beam")
-beam_lut.add_entry("type", beam_type)
-beam_lut.add_entry("voltage_kv", voltage_kv)
-beam_lut.add_entry("voltage_tol_kv", voltage_tol_kv)
-beam_lut.add_entry("current_na", current_na)
-beam_lut.add_entry("current_tol_na", current_tol_na)
-beam_lut.add_entry("hfw_mm", hfw_mm)
-beam_lut.add_entry("working_dist_mm", working_dist_mm)
-beam_lut.add_entry("dynamic_focus", dynamic_focus)
-beam_lut.add_entry("tilt_correction", tilt_correction)
-
-### LASER ###
-laser_pulse_wavelength_nm = LUTField(
-    "Wavelength (nm)",
-    wavelengths[-1],
-    ctk.MenuButton,
-    {"options": wavelengths, "dtype": int},
-    "The wavelength of the laser.",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pulse_divider = LUTField(
-    "Pulse Divider",
-    "",
-    ctk.Entry,
-    {"dtype": int},
-    "Determines the repetition rate of the laser.",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pulse_energy_uj = LUTField(
-    "Energy (uJ)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The energy of the laser pulse in microjoules.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pulse_polarization = LUTField(
-    "Polarization",
-    polarizations[0],
-    ctk.MenuButton,
-    {"options": polarizations, "dtype": str},
-    "The polarization of the laser.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_objective_position_mm = LUTField(
-    "Objective Position (mm)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The position of the objective lens in millimeters.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_passes = LUTField(
-    "Passes",
-    "",
-    ctk.Entry,
-    {"dtype": int},
-    "The number of passes the laser will make.",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_size_x_um = LUTField(
-    "Size X (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The size of the box in the X direction in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_size_y_um = LUTField(
-    "Size Y (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The size of the box in the Y direction in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_pitch_x_um = LUTField(
-    "Pitch X (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The pitch of the box in the X direction in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_pitch_y_um = LUTField(
-    "Pitch Y (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The pitch of the box in the Y direction in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_scan_type = LUTField(
-    "Scan Type",
-    laser_scan_types_box[-1],
-    ctk.MenuButton,
-    {"options": laser_scan_types_box, "dtype": str},
-    "The type of scan to perform.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_coordinate_ref = LUTField(
-    "Coordinate Reference",
-    coordinate_refs[-1],
-    ctk.MenuButton,
-    {"options": coordinate_refs, "dtype": str},
-    "The reference coordinate for the scan.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_size_um = LUTField(
-    "Size (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The size of the line in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_pitch_um = LUTField(
-    "Pitch (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The pitch of the line in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_rotation_deg = LUTField(
-    "Scan Rotation (deg)",
-    0.0,
-    ctk.Entry,
-    {"dtype": float},
-    "The rotation of the scan in degrees.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_mode = LUTField(
-    "Mode",
-    laser_pattern_modes[-1],
-    ctk.MenuButton,
-    {"options": laser_pattern_modes, "dtype": str},
-    "The mode of the laser.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_pulses_per_pixel = LUTField(
-    "Pulses Per Pixel",
-    "",
-    ctk.Entry,
-    {"dtype": int},
-    "The number of pulses per pixel (only matters for fine).",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pattern_pixel_dwell_ms = LUTField(
-    "Pixel Dwell Time (ms)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The dwell time of the laser in milliseconds (only matters for coarse).",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_beam_shift_x_um = LUTField(
-    "Beam Shift X (um)",
-    0.0,
-    ctk.Entry,
-    {"dtype": float},
-    "The beam shift in the X direction in micrometers. Is applied on top of the hardware shift (i.e. it is applied in addition to any 'Beam Centering' values).",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_beam_shift_y_um = LUTField(
-    "Beam Shift Y (um)",
-    0.0,
-    ctk.Entry,
-    {"dtype": float},
-    "The beam shift in the Y direction in micrometers. Is applied on top of the hardware shift (i.e. it is applied in addition to any 'Beam Centering' values).",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_pulse_lut = LUT("pulse")
-laser_pulse_lut.add_entry("wavelength_nm", laser_pulse_wavelength_nm)
-laser_pulse_lut.add_entry("divider", laser_pulse_divider)
-laser_pulse_lut.add_entry("energy_uj", laser_pulse_energy_uj)
-laser_pulse_lut.add_entry("polarization", laser_pulse_polarization)
-laser_line_pattern_lut = LUT("line")
-laser_line_pattern_lut.add_entry("passes", laser_pattern_passes)
-laser_line_pattern_lut.add_entry("size_um", laser_pattern_size_um)
-laser_line_pattern_lut.add_entry("pitch_um", laser_pattern_pitch_um)
-laser_line_pattern_lut.add_entry("scan_type", laser_pattern_scan_type)
-laser_box_pattern_lut = LUT("box")
-laser_box_pattern_lut.add_entry("passes", laser_pattern_passes)
-laser_box_pattern_lut.add_entry("size_x_um", laser_pattern_size_x_um)
-laser_box_pattern_lut.add_entry("size_y_um", laser_pattern_size_y_um)
-laser_box_pattern_lut.add_entry("pitch_x_um", laser_pattern_pitch_x_um)
-laser_box_pattern_lut.add_entry("pitch_y_um", laser_pattern_pitch_y_um)
-laser_box_pattern_lut.add_entry("scan_type", laser_pattern_scan_type)
-laser_box_pattern_lut.add_entry("coordinate_ref", laser_pattern_coordinate_ref)
-laser_pattern_type_lut = LUT("type")
-laser_pattern_type_lut.add_entry("box", laser_box_pattern_lut)
-laser_pattern_type_lut.add_entry("line", laser_line_pattern_lut)
-laser_pattern_lut = LUT("pattern")
-laser_pattern_lut.add_entry("type", laser_pattern_type_lut)
-laser_pattern_lut.add_entry("rotation_deg", laser_pattern_rotation_deg)
-laser_pattern_lut.add_entry("mode", laser_pattern_mode)
-laser_pattern_lut.add_entry("pulses_per_pixel", laser_pattern_pulses_per_pixel)
-laser_pattern_lut.add_entry("pixel_dwell_ms", laser_pattern_pixel_dwell_ms)
-laser_beam_shift_lut = LUT("beam_shift")
-laser_beam_shift_lut.add_entry("x_um", laser_beam_shift_x_um)
-laser_beam_shift_lut.add_entry("y_um", laser_beam_shift_y_um)
-laser_lut = LUT("laser")
-laser_lut.add_entry("step_general", deepcopy(common_lut))
-laser_lut.add_entry("pulse", deepcopy(laser_pulse_lut))
-laser_lut.add_entry("objective_position_mm", deepcopy(laser_objective_position_mm))
-laser_lut.add_entry("beam_shift", deepcopy(laser_beam_shift_lut))
-laser_lut.add_entry("pattern", deepcopy(laser_pattern_lut))
-# Laser should have a step type and name of laser
-
-### IMAGE ###
-detector_type = LUTField(
-    "Detector Type",
-    detector_types[-1],
-    ctk.MenuButton,
-    {"options": detector_types, "dtype": str},
-    "The type of detector used to acquire the image.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-detector_mode = LUTField(
-    "Detector Mode",
-    detector_modes[-1],
-    ctk.MenuButton,
-    {"options": detector_modes, "dtype": str},
-    "The mode of the detector used to acquire the image.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-brightness_fraction = LUTField(
-    "Brightness Fraction",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "(If auto contrast/brightness is False) The fractional brightness value to use.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-contrast_fraction = LUTField(
-    "Contrast Fraction",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "(If auto contrast/brightness is False) The fractional contrast value to use.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-image_rotation_deg = LUTField(
-    "Scan Rotation (deg)",
-    0.0,
-    ctk.Entry,
-    {"dtype": float},
-    "The rotation of the scan in degrees.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-image_dwell_time_us = LUTField(
-    "Dwell Time (us)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The dwell time of the image in microseconds.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-image_resolution = LUTField(
-    "Resolution",
-    resolutions[-1],
-    ctk.EntryMenuButton,
-    {"options": resolutions, "dtype": str},
-    "The resolution of the image. Can be a present or custom resolution.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-image_bit_depth = LUTField(
-    "Bit Depth",
-    bit_depths[0],
-    ctk.MenuButton,
-    {"options": bit_depths, "dtype": int},
-    "The bit depth of the image.",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-detector_lut = LUT("detector")
-detector_lut.add_entry("type", detector_type)
-detector_lut.add_entry("mode", detector_mode)
-detector_lut.add_entry("brightness", brightness_fraction)
-detector_lut.add_entry("contrast", contrast_fraction)
-detector_lut.add_entry("auto_cb", auto_cb_lut)
-scan_lut = LUT("scan")
-scan_lut.add_entry("rotation_deg", image_rotation_deg)
-scan_lut.add_entry("dwell_time_us", image_dwell_time_us)
-scan_lut.add_entry("resolution", image_resolution)
-image_lut = LUT("image")
-image_lut.add_entry("step_general", deepcopy(common_lut))
-image_lut.add_entry("beam", deepcopy(beam_lut))
-image_lut.add_entry("detector", deepcopy(detector_lut))
-image_lut.add_entry("scan", deepcopy(scan_lut))
-image_lut.add_entry("bit_depth", deepcopy(image_bit_depth))
-# Image should have a step type and name of image
-
-### EDS ###
-eds_lut = LUT("eds")
-eds_lut.add_entry("step_general", deepcopy(common_lut))
-eds_lut.add_entry("beam", deepcopy(beam_lut))
-eds_lut.add_entry("detector", deepcopy(detector_lut))
-eds_lut.add_entry("scan", deepcopy(scan_lut))
-eds_lut.add_entry("bit_depth", deepcopy(image_bit_depth))
-# EDS should be electron beam types only, and should have a step type and name of eds
-
-### EBSD ###
-ebsd_concurrent_eds = LUTField(
-    "Concurrent EDS",
-    False,
-    ctk.Checkbutton,
-    {"offvalue": False, "onvalue": True, "bd": 0, "dtype": bool},
-    "Whether to acquire EDS data concurrently with the EBSD data.",
-    bool,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-ebsd_lut = LUT("ebsd")
-ebsd_lut.add_entry("step_general", deepcopy(common_lut))
-ebsd_lut.add_entry("beam", deepcopy(beam_lut))
-ebsd_lut.add_entry("detector", deepcopy(detector_lut))
-ebsd_lut.add_entry("scan", deepcopy(scan_lut))
-ebsd_lut.add_entry("bit_depth", deepcopy(image_bit_depth))
-ebsd_lut.add_entry("concurrent_EDS", deepcopy(ebsd_concurrent_eds))
-# EBSD should be electron beam types only, and should have a step type and name of ebsd
-
-### PFIB ###
-center_x_um = LUTField(
-    "Center X (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The X coordinate of the center of the milling pattern.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-center_y_um = LUTField(
-    "Center Y (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The Y coordinate of the center of the milling pattern.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-width_um = LUTField(
-    "Width (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The width of the rectangle in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-height_um = LUTField(
-    "Height (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The height of the rectangle in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-depth_um = LUTField(
-    "Depth (um)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The depth of the rectangle in micrometers.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-scan_direction = LUTField(
-    "Scan Direction",
-    fib_scan_dirs[-1],
-    ctk.MenuButton,
-    {"options": fib_scan_dirs, "dtype": str},
-    "The direction of the scan.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-scan_type = LUTField(
-    "Scan Type",
-    fib_scan_types[-1],
-    ctk.MenuButton,
-    {"options": fib_scan_types, "dtype": str},
-    "The type of scan to perform.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-dwell_us = LUTField(
-    "Mill Dwell Time (us)",
-    "",
-    ctk.Entry,
-    {"dtype": float},
-    "The dwell time of the mill in microseconds.",
-    float,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-repeats = LUTField(
-    "Pattern Repeats",
-    "",
-    ctk.Entry,
-    {"dtype": int},
-    "The number of times to repeat the pattern.",
-    int,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-recipe_file = LUTField(
-    "Image Processing Recipe",
-    "",
-    ctk.PathEntry,
-    {"directory": False, "defaultextension": ".py"},
-    "The recipe to use for image processing. Must be a python (.py) file.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-mask_file = LUTField(
-    "Mask File",
-    "",
-    ctk.PathEntry,
-    {"directory": False, "defaultextension": ".tif"},
-    "During this step, the mask file to use for milling will be saved (and overwritten) in this location. Should be a tiff (.tif) file. All masks will be saved automatically during the experiment.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-application_file = LUTField(
-    "Mill Pattern Preset",
-    "",
-    ctk.Entry,
-    {"dtype": str},
-    "The preset to use for milling.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-fib_center_lut = LUT("center")
-fib_center_lut.add_entry("x_um", center_x_um)
-fib_center_lut.add_entry("y_um", center_y_um)
-fib_rectangle_pattern_lut = LUT("rectangle")
-fib_rectangle_pattern_lut.add_entry("center", fib_center_lut)
-fib_rectangle_pattern_lut.add_entry("width_um", width_um)
-fib_rectangle_pattern_lut.add_entry("height_um", height_um)
-fib_rectangle_pattern_lut.add_entry("depth_um", depth_um)
-fib_rectangle_pattern_lut.add_entry("scan_direction", scan_direction)
-fib_rectangle_pattern_lut.add_entry("scan_type", scan_type)
-fib_selected_pattern_lut = LUT("selected_area")
-fib_selected_pattern_lut.add_entry("dwell_us", dwell_us)
-fib_selected_pattern_lut.add_entry("repeats", repeats)
-fib_selected_pattern_lut.add_entry("recipe_file", recipe_file)
-fib_selected_pattern_lut.add_entry("mask_file", mask_file)
-fib_pattern_type_lut = LUT("type")
-fib_pattern_type_lut.add_entry("rectangle", fib_rectangle_pattern_lut)
-fib_pattern_type_lut.add_entry("regular_cross_section", fib_rectangle_pattern_lut)
-fib_pattern_type_lut.add_entry("cleaning_cross_section", fib_rectangle_pattern_lut)
-fib_pattern_type_lut.add_entry("selected_area", fib_selected_pattern_lut)
-fib_pattern_lut = LUT("pattern")
-fib_pattern_lut.add_entry("application_file", application_file)
-fib_pattern_lut.add_entry("type", fib_pattern_type_lut)
-fib_mill_lut = LUT("mill")
-fib_mill_lut.add_entry("beam", beam_lut)
-fib_mill_lut.add_entry("pattern", fib_pattern_lut)
-fib_image_lut = LUT("image")
-fib_image_lut.add_entry("beam", beam_lut)
-fib_image_lut.add_entry("detector", detector_lut)
-fib_image_lut.add_entry("scan", scan_lut)
-fib_image_lut.add_entry("bit_depth", image_bit_depth)
-fib_lut = LUT("fib")
-fib_lut.add_entry("step_general", deepcopy(common_lut))
-fib_lut.add_entry("image", deepcopy(fib_image_lut))
-fib_lut.add_entry("mill", deepcopy(fib_mill_lut))
-# FIB should be ion beam types only, dynamic focus should be off, and tilt correction should be off, and step type and name should be fib
-
-### Custom step ###
-custom_executable_path = LUTField(
-    "Executable Path",
-    "",
-    ctk.PathEntry,
-    {"directory": False, "operation": "open"},
-    "The path to the executable to run. For python, this would be the location of the python executable.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-custom_script_path = LUTField(
-    "Custom Script Path",
-    "",
-    ctk.PathEntry,
-    {"directory": False, "operation": "open"},
-    "The path to the custom script to run.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-custom_lut = LUT("custom")
-custom_lut.add_entry("step_general", deepcopy(common_lut))
-custom_lut.add_entry("executable_path", deepcopy(custom_executable_path))
-custom_lut.add_entry("script_path", deepcopy(custom_script_path))
-# Custom should have a step type and name of custom
-
-# Apply edits to luts based on step type (enforce names/types, disable/enable fields, etc.)
-laser_lut["step_general"]["step_type"] = LUTField(
-    "Step Type",
-    "laser",
-    ctk.Entry,
-    {"state": "disabled", "dtype": str},
-    "The step type.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-laser_lut["step_general"]["step_name"] = LUTField(
-    "Step Name",
-    "laser",
-    ctk.Entry,
-    {"dtype": str},
-    "The name of the step.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-image_lut["step_general"]["step_type"] = LUTField(
-    "Step Type",
-    "image",
-    ctk.Entry,
-    {"state": "disabled", "dtype": str},
-    "The step type.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-image_lut["step_general"]["step_name"] = LUTField(
-    "Step Name",
-    "image",
-    ctk.Entry,
-    {"dtype": str},
-    "The name of the step.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-eds_lut["step_general"]["step_type"] = LUTField(
-    "Step Type",
-    "eds",
-    ctk.Entry,
-    {"state": "disabled", "dtype": str},
-    "The step type.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-eds_lut["step_general"]["step_name"] = LUTField(
-    "Step Name",
-    "eds",
-    ctk.Entry,
-    {"dtype": str},
-    "The name of the step.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-eds_lut["beam"]["type"] = LUTField(
-    "Beam Type",
-    beam_types[0],
-    ctk.MenuButton,
-    {"options": beam_types, "dtype": str, "state": "disabled"},
-    "The type of beam used to acquire the image.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-ebsd_lut["step_general"]["step_type"] = LUTField(
-    "Step Type",
-    "ebsd",
-    ctk.Entry,
-    {"state": "disabled", "dtype": str},
-    "The step type.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-ebsd_lut["step_general"]["step_name"] = LUTField(
-    "Step Name",
-    "ebsd",
-    ctk.Entry,
-    {"dtype": str},
-    "The name of the step.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-ebsd_lut["beam"]["type"] = LUTField(
-    "Beam Type",
-    beam_types[0],
-    ctk.MenuButton,
-    {"options": beam_types, "dtype": str, "state": "disabled"},
-    "The type of beam used to acquire the image.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-fib_lut["step_general"]["step_type"] = LUTField(
-    "Step Type",
-    "fib",
-    ctk.Entry,
-    {"state": "disabled", "dtype": str},
-    "The step type.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-fib_lut["step_general"]["step_name"] = LUTField(
-    "Step Name",
-    "fib",
-    ctk.Entry,
-    {"dtype": str},
-    "The name of the step.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-fib_lut["image"]["beam"]["type"] = LUTField(
-    "Beam Type",
-    beam_types[1],
-    ctk.MenuButton,
-    {"options": beam_types, "dtype": str, "state": "disabled"},
-    "The type of beam used to acquire the image.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-fib_lut["image"]["beam"]["dynamic_focus"] = LUTField(
-    "Use Dynamic Focus",
-    False,
-    ctk.Checkbutton,
-    {
-        "offvalue": False,
-        "onvalue": True,
-        "bd": 0,
-        "dtype": bool,
-        "state": "disabled",
-    },
-    "Whether to use dynamic focusing.",
-    bool,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-fib_lut["image"]["beam"]["tilt_correction"] = LUTField(
-    "Use Tilt Correction",
-    False,
-    ctk.Checkbutton,
-    {
-        "offvalue": False,
-        "onvalue": True,
-        "bd": 0,
-        "dtype": bool,
-        "state": "disabled",
-    },
-    "Whether to use tilt correction.",
-    bool,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-fib_lut["mill"]["beam"]["type"] = LUTField(
-    "Beam Type",
-    beam_types[1],
-    ctk.MenuButton,
-    {"options": beam_types, "dtype": str, "state": "disabled"},
-    "The type of beam used to acquire the image.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-fib_lut["mill"]["beam"]["dynamic_focus"] = LUTField(
-    "Use Dynamic Focus",
-    False,
-    ctk.Checkbutton,
-    {
-        "offvalue": False,
-        "onvalue": True,
-        "bd": 0,
-        "dtype": bool,
-        "state": "disabled",
-    },
-    "Whether to use dynamic focusing.",
-    bool,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-fib_lut["mill"]["beam"]["tilt_correction"] = LUTField(
-    "Use Tilt Correction",
-    False,
-    ctk.Checkbutton,
-    {
-        "offvalue": False,
-        "onvalue": True,
-        "bd": 0,
-        "dtype": bool,
-        "state": "disabled",
-    },
-    "Whether to use tilt correction.",
-    bool,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-custom_lut["step_general"]["step_type"] = LUTField(
-    "Step Type",
-    "custom",
-    ctk.Entry,
-    {"state": "disabled", "dtype": str},
-    "The step type.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-custom_lut["step_general"]["step_name"] = LUTField(
-    "Step Name",
-    "custom",
-    ctk.Entry,
-    {"dtype": str},
-    "The name of the step.",
-    str,
-    tbt.Limit(min=1.0, max=max(VERSIONS)),
-)
-
-
-LUTs = {
-    "general": general_lut,
-    "laser": laser_lut,
-    "image": image_lut,
-    "fib": fib_lut,
-    "eds": eds_lut,
-    "ebsd": ebsd_lut,
-    "custom": custom_lut,
-}
+    def entries(self) -> Mapping[str, Union[LUTField, "LUT"]]:
+        """Read-only view of the entries, change them through the LUT instead."""
+        return self.view()
+
+    def view(
+        self, flat: bool = False, separator: str = "/"
+    ) -> Mapping[str, Union[LUTField, "LUT"]]:
+        """Return a read-only view of the entries or, if ``flat`` is set, of the
+        flattened entries without changing the LUT itself. Use this instead of
+        copying a LUT that is only read. A flat view reflects the LUT at the
+        time it was taken."""
+        if flat:
+            return MappingProxyType(self._flatten(separator=separator))
+        return MappingProxyType(self._entries)
+
+
+def _widgets():
+    """Import the widget classes on first use, so importing this module doesn't load tkinter."""
+    import pytribeam.GUI.CustomTkinterWidgets as ctk
+
+    return ctk
+
+
+_FIELD_CACHE: Dict[tuple, LUTField] = {}
+_KWARGS_CACHE: Dict[tuple, Mapping[str, Any]] = {}
+_LIMIT_CACHE: Dict[tuple, tbt.Limit] = {}
+
+
+def _freeze(value: Any) -> tuple:
+    """Return a hashable key for a value, keeping its type so that e.g. 0 and False differ."""
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    return (type(value), value)
+
+
+def _make_field(
+    label: str,
+    default: Any,
+    widget: Union[str, Type["tk.Widget"]],
+    widget_kwargs: Mapping[str, Any],
+    help_text: str,
+    dtype: Type,
+    version: tbt.Limit,
+) -> LUTField:
+    """Create a LUTField, reusing the instance (and its widget kwargs and version limit)
+    of any identical field that was already created. The widget kwargs are stored as a
+    read-only mapping, with any option lists converted to tuples. The widget can be
+    given by its name in CustomTkinterWidgets, which is kept as is (see
+    LUTField.widget_cls)."""
+    kwargs_key = tuple(
+        sorted((name, _freeze(value)) for name, value in widget_kwargs.items())
+    )
+    frozen_kwargs = _KWARGS_CACHE.get(kwargs_key)
+    if frozen_kwargs is None:
+        frozen_kwargs = _KWARGS_CACHE[kwargs_key] = MappingProxyType(
+            {
+                name: tuple(value) if isinstance(value, list) else value
+                for name, value in widget_kwargs.items()
+            }
+        )
+    widget_kwargs = frozen_kwargs
+    version = _LIMIT_CACHE.setdefault(tuple(version), version)
+
+    field_key = (
+        label,
+        _freeze(default),
+        widget,
+        kwargs_key,
+        help_text,
+        dtype,
+        tuple(version),
+    )
+    field = _FIELD_CACHE.get(field_key)
+    if field is None:
+        # Labels and help texts repeat between fields that differ otherwise
+        # (e.g. the step name of each step type), so keep one copy of each
+        if type(default) is str:
+            default = sys.intern(default)
+        field = _FIELD_CACHE[field_key] = LUTField(
+            sys.intern(label),
+            default,
+            widget,
+            widget_kwargs,
+            sys.intern(help_text),
+            dtype,
+            version,
+        )
+    return field
+
+
+def _build_general_lut() -> LUT:
+    """Build the LUT for the general experiment settings."""
+    slice_thickness_um = _make_field(
+        "Slice Thickness (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "Thickness of the laser cut slice in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    max_slice_num = _make_field(
+        "Max Slice Number",
+        "",
+        "Entry",
+        {"dtype": int},
+        "The maximum slice number to cut. The experiment will stop after this slice number is complete.",
+        int,
+        _LIMIT_V1_0,
+    )
+    pre_tilt_deg = _make_field(
+        "Pre-Tilt Angle (deg)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The angle to pre-tilt sample holder used. This angle impacts how stage movements are determined.",
+        float,
+        _LIMIT_V1_0,
+    )
+    sectioning_axis = _make_field(
+        "Sectioning Axis",
+        "Z",
+        "MenuButton",
+        {"options": ["X", "Y", "Z"], "dtype": str, "state": "disabled"},
+        "The axis that the laser will cut along. Can be X, Y, or Z.",
+        str,
+        _LIMIT_V1_0,
+    )
+    stage_translational_tol_um = _make_field(
+        "Stage Translational Tolerance (um)",
+        0.5,
+        "Entry",
+        {"dtype": float},
+        "The tolerance for translational stage movements in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    stage_angular_tol_deg = _make_field(
+        "Stage Angular Tolerance (deg)",
+        0.02,
+        "Entry",
+        {"dtype": float},
+        "The tolerance for angular stage movements in degrees.",
+        float,
+        _LIMIT_V1_0,
+    )
+    connection_host = _make_field(
+        "Connection Host",
+        "localhost",
+        "Entry",
+        {"dtype": str},
+        "The host of the connection to the SEM.",
+        str,
+        _LIMIT_V1_0,
+    )
+    connection_port = _make_field(
+        "Connection Port",
+        "",
+        "Entry",
+        {"dtype": int},
+        "The port of the connection to the SEM.",
+        int,
+        _LIMIT_V1_0,
+    )
+    ebsd_oem = _make_field(
+        "EBSD OEM",
+        "",
+        "MenuButton",
+        {"options": ["EDAX", "Oxford", "null"], "dtype": str},
+        "The OEM of the EBSD system being used.",
+        str,
+        _LIMIT_V1_0,
+    )
+    eds_oem = _make_field(
+        "EDS OEM",
+        "",
+        "MenuButton",
+        {"options": ["EDAX", "Oxford", "null"], "dtype": str},
+        "The OEM of the EDS system being used.",
+        str,
+        _LIMIT_V1_0,
+    )
+    exp_dir = _make_field(
+        "Experiment Directory",
+        "./",
+        "PathEntry",
+        {"directory": True},
+        "The directory where the experiment data is saved.",
+        str,
+        _LIMIT_V1_0,
+    )
+    h5_log_name = _make_field(
+        "H5 Log Name",
+        "log",
+        "Entry",
+        {"dtype": str},
+        "The name of the HDF5 log file.",
+        str,
+        _LIMIT_V1_0,
+    )
+    step_count = _make_field(
+        "Step Count",
+        0,
+        "Entry",
+        {"dtype": int},
+        "The number of steps in the experiment.",
+        int,
+        _LIMIT_V1_0,
+    )
+    general_lut = LUT("general")
+    general_lut.extend(
+        (
+            ("slice_thickness_um", slice_thickness_um),
+            ("max_slice_num", max_slice_num),
+            ("pre_tilt_deg", pre_tilt_deg),
+            ("sectioning_axis", sectioning_axis),
+            ("stage_translational_tol_um", stage_translational_tol_um),
+            ("stage_angular_tol_deg", stage_angular_tol_deg),
+            ("connection_host", connection_host),
+            ("connection_port", connection_port),
+            ("EBSD_OEM", ebsd_oem),
+            ("EDS_OEM", eds_oem),
+            ("exp_dir", exp_dir),
+            ("h5_log_name", h5_log_name),
+            ("step_count", step_count),
+        )
+    )
+    return general_lut
+
+
+# The sub-LUTs from the builders below are built once and shared between the
+# step LUTs, so they must not be changed in place. Step specific overrides are
+# made with LUT.set_path, which copies the nested LUTs it passes through.
+@functools.lru_cache(maxsize=None)
+def _build_stage_lut() -> LUT:
+    """Build the LUT for the stage settings common to all steps."""
+    options = _build_options()
+    rotation_sides = options["rotation_sides"]
+    x_mm = _make_field(
+        "Start X Position (mm)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The starting X position of the laser cut.",
+        float,
+        _LIMIT_V1_0,
+    )
+    y_mm = _make_field(
+        "Start Y Position (mm)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The starting Y position of the laser cut.",
+        float,
+        _LIMIT_V1_0,
+    )
+    z_mm = _make_field(
+        "Start Z Position (mm)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The starting Z position of the laser cut.",
+        float,
+        _LIMIT_V1_0,
+    )
+    t_deg = _make_field(
+        "Start T Position (°)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The starting T position of the laser cut.",
+        float,
+        _LIMIT_V1_0,
+    )
+    r_deg = _make_field(
+        "Start R Position (°)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The starting R position of the laser cut.",
+        float,
+        _LIMIT_V1_0,
+    )
+    rotation_side = _make_field(
+        "Rotation Side",
+        rotation_sides[-1],
+        "MenuButton",
+        {"options": rotation_sides, "dtype": str},
+        "Whether the sample pretilt is in the laser position or the FIB position.",
+        str,
+        _LIMIT_V1_0,
+    )
+    initial_pos_lut = LUT("initial_position")
+    initial_pos_lut.extend(
+        (
+            ("x_mm", x_mm),
+            ("y_mm", y_mm),
+            ("z_mm", z_mm),
+            ("t_deg", t_deg),
+            ("r_deg", r_deg),
+        )
+    )
+    stage_lut = LUT("stage")
+    stage_lut.extend(
+        (
+            ("rotation_side", rotation_side),
+            ("initial_position", initial_pos_lut),
+        )
+    )
+    return stage_lut
+
+
+@functools.lru_cache(maxsize=None)
+def _build_common_lut() -> LUT:
+    """Build the LUT for the general settings common to all steps."""
+    step_name = _make_field(
+        "Step Name",
+        "",
+        "Entry",
+        {"dtype": str},
+        "The name of the step.",
+        str,
+        _LIMIT_V1_0,
+    )
+    step_number = _make_field(
+        "Step Number",
+        "",
+        "Entry",
+        {"state": "disabled", "dtype": int},
+        "The number of the step in the sequence of steps.",
+        int,
+        _LIMIT_V1_0,
+    )
+    step_type = _make_field(
+        "Step Type",
+        "",
+        "Entry",
+        {"state": "disabled", "dtype": str},
+        "The step type.",
+        str,
+        _LIMIT_V1_0,
+    )
+    frequency = _make_field(
+        "Frequency",
+        1,
+        "Entry",
+        {"dtype": int},
+        "The frequency that this step is activated (i.e. 1 means every slice, 2 means every other slice, etc.).",
+        int,
+        _LIMIT_V1_0,
+    )
+    common_lut = LUT("stage")
+    common_lut.extend(
+        (
+            ("step_name", step_name),
+            ("step_number", step_number),
+            ("step_type", step_type),
+            ("frequency", frequency),
+            ("stage", _build_stage_lut()),
+        )
+    )
+    return common_lut
+
+
+@functools.lru_cache(maxsize=None)
+def _build_auto_cb_lut() -> LUT:
+    """Build the LUT for the auto contrast/brightness settings."""
+    left = _make_field(
+        "Left Fraction",
+        "",
+        "Entry",
+        {"dtype": float},
+        "Fractional position (of the entire image) for the left edge of the reduced area for auto contrast and brightness adjustment. Empty/None/null for all fractions turns off ACB.",
+        float,
+        _LIMIT_V1_0,
+    )
+    width = _make_field(
+        "Width Fraction",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The fractional width (of the entire image) to use for auto contrast and brightness. Empty/None for all fractions turns off ACB.",
+        float,
+        _LIMIT_V1_0,
+    )
+    top = _make_field(
+        "Top Fraction",
+        "",
+        "Entry",
+        {"dtype": float},
+        "Fractional position (of the entire image) for the top edge of the reduced area for auto contrast and brightness adjustment. Empty/None for all fractions turns off ACB.",
+        float,
+        _LIMIT_V1_0,
+    )
+    height = _make_field(
+        "Height Fraction",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The fractional height (of the entire image) to use for auto contrast and brightness. Empty/None for all fractions turns off ACB.",
+        float,
+        _LIMIT_V1_0,
+    )
+    auto_cb_lut = LUT("auto_cb")
+    auto_cb_lut.extend(
+        (
+            ("left", left),
+            ("width", width),
+            ("top", top),
+            ("height", height),
+        )
+    )
+    return auto_cb_lut
+
+
+@functools.lru_cache(maxsize=None)
+def _build_beam_lut() -> LUT:
+    """Build the LUT for the beam settings."""
+    options = _build_options()
+    beam_types = options["beam_types"]
+    beam_type = _make_field(
+        "Beam Type",
+        beam_types[-1],
+        "MenuButton",
+        {"options": beam_types, "dtype": str},
+        "The type of beam used to acquire the image.",
+        str,
+        _LIMIT_V1_0,
+    )
+    voltage_kv = _make_field(
+        "Beam Voltage (kV)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The voltage of the beam in keV.",
+        float,
+        _LIMIT_V1_0,
+    )
+    voltage_tol_kv = _make_field(
+        "Beam Voltage Tolerance (kV)",
+        0.1,
+        "Entry",
+        {"dtype": float},
+        "The tolerance of the beam voltage in kV.",
+        float,
+        _LIMIT_V1_0,
+    )
+    current_na = _make_field(
+        "Beam Current (nA)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The current of the beam in nA.",
+        float,
+        _LIMIT_V1_0,
+    )
+    current_tol_na = _make_field(
+        "Beam Current Tolerance (nA)",
+        0.5,
+        "Entry",
+        {"dtype": float},
+        "The tolerance of the beam current in nA.",
+        float,
+        _LIMIT_V1_0,
+    )
+    hfw_mm = _make_field(
+        "Horizontal Field Width (mm)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The horizontal field width of the image in mm.",
+        float,
+        _LIMIT_V1_0,
+    )
+    working_dist_mm = _make_field(
+        "Working Distance (mm)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The working distance of the image in mm.",
+        float,
+        _LIMIT_V1_0,
+    )
+    dynamic_focus = _make_field(
+        "Use Dynamic Focus",
+        False,
+        "Checkbutton",
+        _CHECKBUTTON_KWARGS,
+        "Whether to use dynamic focusing.",
+        bool,
+        _LIMIT_V1_0,
+    )
+    tilt_correction = _make_field(
+        "Use Tilt Correction",
+        False,
+        "Checkbutton",
+        _CHECKBUTTON_KWARGS,
+        "Whether to use tilt correction.",
+        bool,
+        _LIMIT_V1_0,
+    )
+    beam_lut = LUT("beam")
+    beam_lut.extend(
+        (
+            ("type", beam_type),
+            ("voltage_kv", voltage_kv),
+            ("voltage_tol_kv", voltage_tol_kv),
+            ("current_na", current_na),
+            ("current_tol_na", current_tol_na),
+            ("hfw_mm", hfw_mm),
+            ("working_dist_mm", working_dist_mm),
+            ("dynamic_focus", dynamic_focus),
+            ("tilt_correction", tilt_correction),
+        )
+    )
+    return beam_lut
+
+
+@functools.lru_cache(maxsize=None)
+def _build_detector_lut() -> LUT:
+    """Build the LUT for the detector settings."""
+    options = _build_options()
+    detector_types = options["detector_types"]
+    detector_modes = options["detector_modes"]
+    detector_type = _make_field(
+        "Detector Type",
+        detector_types[-1],
+        "MenuButton",
+        {"options": detector_types, "dtype": str},
+        "The type of detector used to acquire the image.",
+        str,
+        _LIMIT_V1_0,
+    )
+    detector_mode = _make_field(
+        "Detector Mode",
+        detector_modes[-1],
+        "MenuButton",
+        {"options": detector_modes, "dtype": str},
+        "The mode of the detector used to acquire the image.",
+        str,
+        _LIMIT_V1_0,
+    )
+    brightness_fraction = _make_field(
+        "Brightness Fraction",
+        "",
+        "Entry",
+        {"dtype": float},
+        "(If auto contrast/brightness is False) The fractional brightness value to use.",
+        float,
+        _LIMIT_V1_0,
+    )
+    contrast_fraction = _make_field(
+        "Contrast Fraction",
+        "",
+        "Entry",
+        {"dtype": float},
+        "(If auto contrast/brightness is False) The fractional contrast value to use.",
+        float,
+        _LIMIT_V1_0,
+    )
+    detector_lut = LUT("detector")
+    detector_lut.extend(
+        (
+            ("type", detector_type),
+            ("mode", detector_mode),
+            ("brightness", brightness_fraction),
+            ("contrast", contrast_fraction),
+            ("auto_cb", _build_auto_cb_lut()),
+        )
+    )
+    return detector_lut
+
+
+@functools.lru_cache(maxsize=None)
+def _build_scan_lut() -> LUT:
+    """Build the LUT for the scan settings."""
+    options = _build_options()
+    resolutions = options["resolutions"]
+    image_rotation_deg = _make_field(
+        "Scan Rotation (deg)",
+        0.0,
+        "Entry",
+        {"dtype": float},
+        "The rotation of the scan in degrees.",
+        float,
+        _LIMIT_V1_0,
+    )
+    image_dwell_time_us = _make_field(
+        "Dwell Time (us)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The dwell time of the image in microseconds.",
+        float,
+        _LIMIT_V1_0,
+    )
+    image_resolution = _make_field(
+        "Resolution",
+        resolutions[-1],
+        "EntryMenuButton",
+        {"options": resolutions, "dtype": str},
+        "The resolution of the image. Can be a present or custom resolution.",
+        str,
+        _LIMIT_V1_0,
+    )
+    scan_lut = LUT("scan")
+    scan_lut.extend(
+        (
+            ("rotation_deg", image_rotation_deg),
+            ("dwell_time_us", image_dwell_time_us),
+            ("resolution", image_resolution),
+        )
+    )
+    return scan_lut
+
+
+def _build_bit_depth() -> LUTField:
+    """Build the field for the image bit depth."""
+    options = _build_options()
+    bit_depths = options["bit_depths"]
+    image_bit_depth = _make_field(
+        "Bit Depth",
+        bit_depths[0],
+        "MenuButton",
+        {"options": bit_depths, "dtype": int},
+        "The bit depth of the image.",
+        int,
+        _LIMIT_V1_0,
+    )
+    return image_bit_depth
+
+
+@functools.lru_cache(maxsize=None)
+def _step_overrides() -> Dict[str, Tuple[Tuple[Tuple[str, ...], LUTField], ...]]:
+    """The fields each step type sets in the sub-LUTs it shares with the other
+    steps, as (path, field) pairs by step type. Every step enforces its own type
+    and name, while EDS and EBSD are limited to the electron beam and FIB to the
+    ion beam, without dynamic focus or tilt correction."""
+    beam_types = _build_options()["beam_types"]
+    overrides = {
+        step_type: [
+            (
+                ("step_general", "step_type"),
+                _make_field(
+                    "Step Type",
+                    step_type,
+                    "Entry",
+                    {"state": "disabled", "dtype": str},
+                    "The step type.",
+                    str,
+                    _LIMIT_V1_0,
+                ),
+            ),
+            (
+                ("step_general", "step_name"),
+                _make_field(
+                    "Step Name",
+                    step_type,
+                    "Entry",
+                    {"dtype": str},
+                    "The name of the step.",
+                    str,
+                    _LIMIT_V1_0,
+                ),
+            ),
+        ]
+        for step_type in ("laser", "image", "eds", "ebsd", "fib", "custom")
+    }
+
+    def beam_type(index: int) -> LUTField:
+        return _make_field(
+            "Beam Type",
+            beam_types[index],
+            "MenuButton",
+            {"options": beam_types, "dtype": str, "state": "disabled"},
+            "The type of beam used to acquire the image.",
+            str,
+            _LIMIT_V1_0,
+        )
+
+    no_dynamic_focus = _make_field(
+        "Use Dynamic Focus",
+        False,
+        "Checkbutton",
+        _DISABLED_CHECKBUTTON_KWARGS,
+        "Whether to use dynamic focusing.",
+        bool,
+        _LIMIT_V1_0,
+    )
+    no_tilt_correction = _make_field(
+        "Use Tilt Correction",
+        False,
+        "Checkbutton",
+        _DISABLED_CHECKBUTTON_KWARGS,
+        "Whether to use tilt correction.",
+        bool,
+        _LIMIT_V1_0,
+    )
+    overrides["eds"].append((("beam", "type"), beam_type(0)))
+    overrides["ebsd"].append((("beam", "type"), beam_type(0)))
+    for section in ("image", "mill"):
+        overrides["fib"].extend(
+            (
+                ((section, "beam", "type"), beam_type(1)),
+                ((section, "beam", "dynamic_focus"), no_dynamic_focus),
+                ((section, "beam", "tilt_correction"), no_tilt_correction),
+            )
+        )
+    return {step_type: tuple(fields) for step_type, fields in overrides.items()}
+
+
+def _apply_step_overrides(lut: LUT, step_type: str):
+    """Set the step specific fields of a step LUT, leaving the shared sub-LUTs unchanged."""
+    for path, field in _step_overrides()[step_type]:
+        lut.set_path(path, field)
+
+
+def _build_laser_lut() -> LUT:
+    """Build the LUT for laser steps."""
+    options = _build_options()
+    wavelengths = options["wavelengths"]
+    polarizations = options["polarizations"]
+    coordinate_refs = options["coordinate_refs"]
+    laser_scan_types_box = options["laser_scan_types_box"]
+    laser_pattern_modes = options["laser_pattern_modes"]
+    laser_pulse_wavelength_nm = _make_field(
+        "Wavelength (nm)",
+        wavelengths[-1],
+        "MenuButton",
+        {"options": wavelengths, "dtype": int},
+        "The wavelength of the laser.",
+        int,
+        _LIMIT_V1_0,
+    )
+    laser_pulse_divider = _make_field(
+        "Pulse Divider",
+        "",
+        "Entry",
+        {"dtype": int},
+        "Determines the repetition rate of the laser.",
+        int,
+        _LIMIT_V1_0,
+    )
+    laser_pulse_energy_uj = _make_field(
+        "Energy (uJ)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The energy of the laser pulse in microjoules.",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_pulse_polarization = _make_field(
+        "Polarization",
+        polarizations[0],
+        "MenuButton",
+        {"options": polarizations, "dtype": str},
+        "The polarization of the laser.",
+        str,
+        _LIMIT_V1_0,
+    )
+    laser_objective_position_mm = _make_field(
+        "Objective Position (mm)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The position of the objective lens in millimeters.",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_passes = _make_field(
+        "Passes",
+        "",
+        "Entry",
+        {"dtype": int},
+        "The number of passes the laser will make.",
+        int,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_size_x_um = _make_field(
+        "Size X (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The size of the box in the X direction in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_size_y_um = _make_field(
+        "Size Y (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The size of the box in the Y direction in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_pitch_x_um = _make_field(
+        "Pitch X (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The pitch of the box in the X direction in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_pitch_y_um = _make_field(
+        "Pitch Y (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The pitch of the box in the Y direction in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_scan_type = _make_field(
+        "Scan Type",
+        laser_scan_types_box[-1],
+        "MenuButton",
+        {"options": laser_scan_types_box, "dtype": str},
+        "The type of scan to perform.",
+        str,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_coordinate_ref = _make_field(
+        "Coordinate Reference",
+        coordinate_refs[-1],
+        "MenuButton",
+        {"options": coordinate_refs, "dtype": str},
+        "The reference coordinate for the scan.",
+        str,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_size_um = _make_field(
+        "Size (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The size of the line in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_pitch_um = _make_field(
+        "Pitch (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The pitch of the line in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_rotation_deg = _make_field(
+        "Scan Rotation (deg)",
+        0.0,
+        "Entry",
+        {"dtype": float},
+        "The rotation of the scan in degrees.",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_mode = _make_field(
+        "Mode",
+        laser_pattern_modes[-1],
+        "MenuButton",
+        {"options": laser_pattern_modes, "dtype": str},
+        "The mode of the laser.",
+        str,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_pulses_per_pixel = _make_field(
+        "Pulses Per Pixel",
+        "",
+        "Entry",
+        {"dtype": int},
+        "The number of pulses per pixel (only matters for fine).",
+        int,
+        _LIMIT_V1_0,
+    )
+    laser_pattern_pixel_dwell_ms = _make_field(
+        "Pixel Dwell Time (ms)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The dwell time of the laser in milliseconds (only matters for coarse).",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_beam_shift_x_um = _make_field(
+        "Beam Shift X (um)",
+        0.0,
+        "Entry",
+        {"dtype": float},
+        "The beam shift in the X direction in micrometers. Is applied on top of the hardware shift (i.e. it is applied in addition to any 'Beam Centering' values).",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_beam_shift_y_um = _make_field(
+        "Beam Shift Y (um)",
+        0.0,
+        "Entry",
+        {"dtype": float},
+        "The beam shift in the Y direction in micrometers. Is applied on top of the hardware shift (i.e. it is applied in addition to any 'Beam Centering' values).",
+        float,
+        _LIMIT_V1_0,
+    )
+    laser_pulse_lut = LUT("pulse")
+    laser_pulse_lut.extend(
+        (
+            ("wavelength_nm", laser_pulse_wavelength_nm),
+            ("divider", laser_pulse_divider),
+            ("energy_uj", laser_pulse_energy_uj),
+            ("polarization", laser_pulse_polarization),
+        )
+    )
+    laser_line_pattern_lut = LUT("line")
+    laser_line_pattern_lut.extend(
+        (
+            ("passes", laser_pattern_passes),
+            ("size_um", laser_pattern_size_um),
+            ("pitch_um", laser_pattern_pitch_um),
+            ("scan_type", laser_pattern_scan_type),
+        )
+    )
+    laser_box_pattern_lut = LUT("box")
+    laser_box_pattern_lut.extend(
+        (
+            ("passes", laser_pattern_passes),
+            ("size_x_um", laser_pattern_size_x_um),
+            ("size_y_um", laser_pattern_size_y_um),
+            ("pitch_x_um", laser_pattern_pitch_x_um),
+            ("pitch_y_um", laser_pattern_pitch_y_um),
+            ("scan_type", laser_pattern_scan_type),
+            ("coordinate_ref", laser_pattern_coordinate_ref),
+        )
+    )
+    laser_pattern_type_lut = LUT("type")
+    laser_pattern_type_lut.extend(
+        (
+            ("box", laser_box_pattern_lut),
+            ("line", laser_line_pattern_lut),
+        )
+    )
+    laser_pattern_lut = LUT("pattern")
+    laser_pattern_lut.extend(
+        (
+            ("type", laser_pattern_type_lut),
+            ("rotation_deg", laser_pattern_rotation_deg),
+            ("mode", laser_pattern_mode),
+            ("pulses_per_pixel", laser_pattern_pulses_per_pixel),
+            ("pixel_dwell_ms", laser_pattern_pixel_dwell_ms),
+        )
+    )
+    laser_beam_shift_lut = LUT("beam_shift")
+    laser_beam_shift_lut.extend(
+        (
+            ("x_um", laser_beam_shift_x_um),
+            ("y_um", laser_beam_shift_y_um),
+        )
+    )
+    laser_lut = LUT("laser")
+    laser_lut.extend(
+        (
+            ("step_general", _build_common_lut()),
+            ("pulse", laser_pulse_lut),
+            ("objective_position_mm", laser_objective_position_mm),
+            ("beam_shift", laser_beam_shift_lut),
+            ("pattern", laser_pattern_lut),
+        )
+    )
+    _apply_step_overrides(laser_lut, "laser")
+    return laser_lut
+
+
+def _build_image_lut() -> LUT:
+    """Build the LUT for image steps."""
+    image_lut = LUT("image")
+    image_lut.extend(
+        (
+            ("step_general", _build_common_lut()),
+            ("beam", _build_beam_lut()),
+            ("detector", _build_detector_lut()),
+            ("scan", _build_scan_lut()),
+            ("bit_depth", _build_bit_depth()),
+        )
+    )
+    _apply_step_overrides(image_lut, "image")
+    return image_lut
+
+
+def _build_eds_lut() -> LUT:
+    """Build the LUT for EDS steps. EDS is limited to the electron beam."""
+    eds_lut = LUT("eds")
+    eds_lut.extend(
+        (
+            ("step_general", _build_common_lut()),
+            ("beam", _build_beam_lut()),
+            ("detector", _build_detector_lut()),
+            ("scan", _build_scan_lut()),
+            ("bit_depth", _build_bit_depth()),
+        )
+    )
+    _apply_step_overrides(eds_lut, "eds")
+    return eds_lut
+
+
+def _build_ebsd_lut() -> LUT:
+    """Build the LUT for EBSD steps. EBSD is limited to the electron beam."""
+    ebsd_concurrent_eds = _make_field(
+        "Concurrent EDS",
+        False,
+        "Checkbutton",
+        _CHECKBUTTON_KWARGS,
+        "Whether to acquire EDS data concurrently with the EBSD data.",
+        bool,
+        _LIMIT_V1_0,
+    )
+    ebsd_lut = LUT("ebsd")
+    ebsd_lut.extend(
+        (
+            ("step_general", _build_common_lut()),
+            ("beam", _build_beam_lut()),
+            ("detector", _build_detector_lut()),
+            ("scan", _build_scan_lut()),
+            ("bit_depth", _build_bit_depth()),
+            ("concurrent_EDS", ebsd_concurrent_eds),
+        )
+    )
+    _apply_step_overrides(ebsd_lut, "ebsd")
+    return ebsd_lut
+
+
+def _build_fib_lut() -> LUT:
+    """Build the LUT for FIB steps. FIB is limited to the ion beam, without dynamic focus or tilt correction."""
+    options = _build_options()
+    fib_scan_dirs = options["fib_scan_dirs"]
+    fib_scan_types = options["fib_scan_types"]
+    center_x_um = _make_field(
+        "Center X (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The X coordinate of the center of the milling pattern.",
+        float,
+        _LIMIT_V1_0,
+    )
+    center_y_um = _make_field(
+        "Center Y (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The Y coordinate of the center of the milling pattern.",
+        float,
+        _LIMIT_V1_0,
+    )
+    width_um = _make_field(
+        "Width (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The width of the rectangle in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    height_um = _make_field(
+        "Height (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The height of the rectangle in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    depth_um = _make_field(
+        "Depth (um)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The depth of the rectangle in micrometers.",
+        float,
+        _LIMIT_V1_0,
+    )
+    scan_direction = _make_field(
+        "Scan Direction",
+        fib_scan_dirs[-1],
+        "MenuButton",
+        {"options": fib_scan_dirs, "dtype": str},
+        "The direction of the scan.",
+        str,
+        _LIMIT_V1_0,
+    )
+    scan_type = _make_field(
+        "Scan Type",
+        fib_scan_types[-1],
+        "MenuButton",
+        {"options": fib_scan_types, "dtype": str},
+        "The type of scan to perform.",
+        str,
+        _LIMIT_V1_0,
+    )
+    dwell_us = _make_field(
+        "Mill Dwell Time (us)",
+        "",
+        "Entry",
+        {"dtype": float},
+        "The dwell time of the mill in microseconds.",
+        float,
+        _LIMIT_V1_0,
+    )
+    repeats = _make_field(
+        "Pattern Repeats",
+        "",
+        "Entry",
+        {"dtype": int},
+        "The number of times to repeat the pattern.",
+        int,
+        _LIMIT_V1_0,
+    )
+    recipe_file = _make_field(
+        "Image Processing Recipe",
+        "",
+        "PathEntry",
+        {"directory": False, "defaultextension": ".py"},
+        "The recipe to use for image processing. Must be a python (.py) file.",
+        str,
+        _LIMIT_V1_0,
+    )
+    mask_file = _make_field(
+        "Mask File",
+        "",
+        "PathEntry",
+        {"directory": False, "defaultextension": ".tif"},
+        "During this step, the mask file to use for milling will be saved (and overwritten) in this location. Should be a tiff (.tif) file. All masks will be saved automatically during the experiment.",
+        str,
+        _LIMIT_V1_0,
+    )
+    application_file = _make_field(
+        "Mill Pattern Preset",
+        "",
+        "Entry",
+        {"dtype": str},
+        "The preset to use for milling.",
+        str,
+        _LIMIT_V1_0,
+    )
+    fib_center_lut = LUT("center")
+    fib_center_lut.extend(
+        (
+            ("x_um", center_x_um),
+            ("y_um", center_y_um),
+        )
+    )
+    fib_rectangle_pattern_lut = LUT("rectangle")
+    fib_rectangle_pattern_lut.extend(
+        (
+            ("center", fib_center_lut),
+            ("width_um", width_um),
+            ("height_um", height_um),
+            ("depth_um", depth_um),
+            ("scan_direction", scan_direction),
+            ("scan_type", scan_type),
+        )
+    )
+    fib_selected_pattern_lut = LUT("selected_area")
+    fib_selected_pattern_lut.extend(
+        (
+            ("dwell_us", dwell_us),
+            ("repeats", repeats),
+            ("recipe_file", recipe_file),
+            ("mask_file", mask_file),
+        )
+    )
+    # The rectangular pattern types only differ by their key, so they all share
+    # the same (never modified) sub-LUT rather than holding copies of it.
+    fib_pattern_type_lut = LUT("type")
+    fib_pattern_type_lut.extend(
+        (
+            ("rectangle", fib_rectangle_pattern_lut),
+            ("regular_cross_section", fib_rectangle_pattern_lut),
+            ("cleaning_cross_section", fib_rectangle_pattern_lut),
+            ("selected_area", fib_selected_pattern_lut),
+        )
+    )
+    fib_pattern_lut = LUT("pattern")
+    fib_pattern_lut.extend(
+        (
+            ("application_file", application_file),
+            ("type", fib_pattern_type_lut),
+        )
+    )
+    fib_mill_lut = LUT("mill")
+    fib_mill_lut.extend(
+        (
+            ("beam", _build_beam_lut()),
+            ("pattern", fib_pattern_lut),
+        )
+    )
+    fib_image_lut = LUT("image")
+    fib_image_lut.extend(
+        (
+            ("beam", _build_beam_lut()),
+            ("detector", _build_detector_lut()),
+            ("scan", _build_scan_lut()),
+            ("bit_depth", _build_bit_depth()),
+        )
+    )
+    fib_lut = LUT("fib")
+    fib_lut.extend(
+        (
+            ("step_general", _build_common_lut()),
+            ("image", fib_image_lut),
+            ("mill", fib_mill_lut),
+        )
+    )
+    _apply_step_overrides(fib_lut, "fib")
+    return fib_lut
+
+
+def _build_custom_lut() -> LUT:
+    """Build the LUT for custom steps."""
+    custom_executable_path = _make_field(
+        "Executable Path",
+        "",
+        "PathEntry",
+        {"directory": False, "operation": "open"},
+        "The path to the executable to run. For python, this would be the location of the python executable.",
+        str,
+        _LIMIT_V1_0,
+    )
+    custom_script_path = _make_field(
+        "Custom Script Path",
+        "",
+        "PathEntry",
+        {"directory": False, "operation": "open"},
+        "The path to the custom script to run.",
+        str,
+        _LIMIT_V1_0,
+    )
+    custom_lut = LUT("custom")
+    custom_lut.extend(
+        (
+            ("step_general", _build_common_lut()),
+            ("executable_path", custom_executable_path),
+            ("script_path", custom_script_path),
+        )
+    )
+    _apply_step_overrides(custom_lut, "custom")
+    return custom_lut
+
+
+@functools.lru_cache(maxsize=None)
+def get_general_lut() -> LUT:
+    """Return the shared LUT for the general settings, built on first use."""
+    return _build_general_lut()
+
+
+@functools.lru_cache(maxsize=None)
+def get_laser_lut() -> LUT:
+    """Return the shared LUT for laser steps, built on first use."""
+    return _build_laser_lut()
+
+
+@functools.lru_cache(maxsize=None)
+def get_image_lut() -> LUT:
+    """Return the shared LUT for image steps, built on first use."""
+    return _build_image_lut()
+
+
+@functools.lru_cache(maxsize=None)
+def get_fib_lut() -> LUT:
+    """Return the shared LUT for fib steps, built on first use."""
+    return _build_fib_lut()
+
+
+@functools.lru_cache(maxsize=None)
+def get_eds_lut() -> LUT:
+    """Return the shared LUT for eds steps, built on first use."""
+    return _build_eds_lut()
+
+
+@functools.lru_cache(maxsize=None)
+def get_ebsd_lut() -> LUT:
+    """Return the shared LUT for ebsd steps, built on first use."""
+    return _build_ebsd_lut()
+
+
+@functools.lru_cache(maxsize=None)
+def get_custom_lut() -> LUT:
+    """Return the shared LUT for custom steps, built on first use."""
+    return _build_custom_lut()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_luts() -> Mapping[str, LUT]:
+    """Collect the lookup tables for every step type. Done once, on first use.
+    The tables are shared, so they are exposed read-only; use get_lut (or
+    LUT.clone) for a copy that can be changed."""
+    return MappingProxyType(
+        {
+            "general": get_general_lut(),
+            "laser": get_laser_lut(),
+            "image": get_image_lut(),
+            "fib": get_fib_lut(),
+            "eds": get_eds_lut(),
+            "ebsd": get_ebsd_lut(),
+            "custom": get_custom_lut(),
+        }
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Build the module-level lookup tables and option lists lazily (PEP 562)."""
+    if name == "LUTs":
+        return _build_luts()
+    options = _build_options()
+    if name in options:
+        return options[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class VersionedLUT:
     def __init__(self):
         self.versions = VERSIONS
         self._default_version = max(VERSIONS)
-        self.LUTs = deepcopy(LUTs)
+        # Resolved through the module so that the lazily built tables are used
+        # unless ``LUTs`` has been assigned explicitly. These are shared, not
+        # copied, since get_lut only ever modifies a clone.
+        self.LUTs = sys.modules[__name__].LUTs
+        # The step types and versions are all known here, so every combination
+        # is pruned once up front and get_lut only has to look it up.
+        self._pruned: Dict[Tuple[str, float], LUT] = {
+            (step_type, version): self._prune(lut, version)
+            for step_type, lut in self.LUTs.items()
+            for version in self.versions
+        }
+
+    @staticmethod
+    def _prune(lut: LUT, version: float) -> LUT:
+        """Return a copy of ``lut`` without the fields that don't apply to ``version``."""
+        lut = lut.clone()
+        # Most fields share one of a handful of version limits, so each distinct
+        # limit is only checked once
+        in_range: Dict[Any, bool] = {}
+        for path, entry in list(lut.iter_leaves()):
+            keep = in_range.get(entry.version)
+            if keep is None:
+                keep = in_range[entry.version] = ut.in_interval(
+                    version, entry.version, tbt.IntervalType.CLOSED
+                )
+            if not keep:
+                lut.remove_leaf(path)
+        lut._prune_empty()
+        return lut
 
     def get_lut(self, step_type: str, version: Optional[str] = None) -> LUT:
         """Retrieve the LUT for the given version and step type.
-        This is done by walking through the LUTs and removing the ones that don't match the version and the step type.
+        The LUTs are pruned to the fields that match each version when the VersionedLUT is created.
         If the version is not provided, the highest version is used.
         """
         if version is None:
             version = self._default_version
-        if not any(version == v for v in self.versions):
-            raise ValueError(
-                f"Version {version} is not in the list of versions: {self.versions}"
-            )
-        if step_type.lower() not in self.LUTs:
+        # Valid requests are found with a single lookup, the checks below only
+        # run to report what is wrong with an invalid one
+        lut = self._pruned.get((step_type.lower(), version))
+        if lut is None:
+            if not any(version == v for v in self.versions):
+                raise ValueError(
+                    f"Version {version} is not in the list of versions: {self.versions}"
+                )
             raise ValueError(
                 f"Step type {step_type} is not in the list of step types: {list(self.LUTs.keys())}"
             )
 
-        lut = deepcopy(self.LUTs[step_type.lower()])
-        lut.flatten()
-        items = list(lut.entries.items())
-        for name, entry in items:
-            if not ut.in_interval(version, entry.version, tbt.IntervalType.CLOSED):
-                lut.remove_entry(name)
-        lut.unflatten()
-        lut._prune_empty()
-        return lut
+        # Callers modify the LUT they get (e.g. flatten it), so hand out a copy
+        return lut.clone()
 
 
 def get_lut(step_type: str, version: Optional[str] = None) -> LUT:
@@ -1324,8 +1710,13 @@ def get_lut(step_type: str, version: Optional[str] = None) -> LUT:
     This is done by walking through the LUTs and removing the ones that don't match the version and the step type.
     If the version is not provided, the highest version is used.
     """
-    VLUT = VersionedLUT()
-    return VLUT.get_lut(step_type, version)
+    return _versioned_lut().get_lut(step_type, version)
+
+
+@functools.lru_cache(maxsize=None)
+def _versioned_lut() -> VersionedLUT:
+    """The VersionedLUT shared by every get_lut call, created on first use."""
+    return VersionedLUT()
 
 
 if __name__ == "__main__":
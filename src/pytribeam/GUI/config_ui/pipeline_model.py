@@ -252,8 +252,7 @@ class PipelineConfig:
         try:
             # Get LUT for this step type and version
             step_lut = lut.get_lut(step_type.lower(), self.version)
-            step_lut_flat = deepcopy(step_lut)
-            step_lut_flat.flatten()
+            step_lut_flat = step_lut.view(flat=True)
 
             # Extract all parameters with their defaults
             params = {}
@@ -1,21 +1,18 @@
 import sys
 import shutil
-import time
-import datetime
 import os
 import tkinter as tk
-from tkinter import ttk
 from tkinter import filedialog
 from tkinter import messagebox
 from pathlib import Path
-from PIL import Image, ImageTk
-import contextlib
+import copy
+import threading
 import traceback
+from typing import Any, Callable, Dict, Optional, Tuple
 
 # pytribeam imports
 import pytribeam.GUI.CustomTkinterWidgets as ctk
-from pytribeam.GUI.config_ui.App import Configurator
-from pytribeam import workflow, stage, utilities, log, laser, insertable_devices
+from pytribeam import workflow, stage, utilities, laser
 import pytribeam.types as tbt
 
 # Import refactored common utilities
@@ -25,12 +22,24 @@ from pytribeam.GUI.common import (
     StoppableThread,
     TextRedirector,
 )
-from pytribeam.GUI.common.threading_utils import generate_escape_keypress
 from pytribeam.GUI.runner_util import ExperimentController, ExperimentState
 from pytribeam.GUI.runner_util.ui_components import ControlPanel, StatusPanel
 
 
 class MainApplication(tk.Tk):
+    # How often (in ms) to check whether a background task has finished
+    POLL_INTERVAL_MS = 50
+    # Shortest time (in ms) between status panel refreshes during an experiment
+    STATUS_INTERVAL_MS = 100
+    # Experiment control buttons of the control panel, with the theme color
+    # each one shows while disabled
+    EXP_CONTROL_BUTTONS = (
+        ("start_btn", "green"),
+        ("stop_step_btn", "accent3"),
+        ("stop_slice_btn", "accent3"),
+        ("stop_now_btn", "accent3"),
+    )
+
     def __init__(self, *args, **kwargs):
         # Create core
         tk.Tk.__init__(self, *args, **kwargs)
@@ -66,13 +75,15 @@ class MainApplication(tk.Tk):
 
         # Create variables
         self.config_path = None
-        self.stop_after_slice = tk.BooleanVar()
-        self.stop_after_slice.set(False)
-        self.stop_after_step = tk.BooleanVar()
-        self.stop_after_step.set(False)
-        self.stop_now = tk.BooleanVar()
-        self.stop_now.set(False)
         self.yml_version = None
+        # (path, mtime, size) of the last config file read, with its version and contents
+        self._config_cache = None
+        # Folders last picked in the load config and export log dialogs
+        self._last_config_dir = None
+        self._last_export_dir = None
+        # Experiment control button styles, and the theme they were built for
+        self._button_styles_cache = None
+        self._button_styles_theme = None
 
         # Set the theme
         self.theme = ctk.Theme("dark")
@@ -84,10 +95,16 @@ class MainApplication(tk.Tk):
         self.original_err = sys.stderr
         self.terminal_log_path = self.app_config.get_terminal_log_path()
         sys.stdout = TextRedirector(
-            self.terminal, tag="stdout", log_path=str(self.terminal_log_path)
+            self.terminal,
+            tag="stdout",
+            log_path=str(self.terminal_log_path),
+            max_lines=self.app_config.max_terminal_lines,
         )
         sys.stderr = TextRedirector(
-            self.terminal, tag="stderr", log_path=str(self.terminal_log_path)
+            self.terminal,
+            tag="stderr",
+            log_path=str(self.terminal_log_path),
+            max_lines=self.app_config.max_terminal_lines,
         )
         print("---")
         print("Welcome to TriBeam Layered Acquisition!")
@@ -96,6 +113,8 @@ class MainApplication(tk.Tk):
 
         # Bind the close button to the close function
         self.protocol("WM_DELETE_WINDOW", self.quit)
+        # False once the window is destroyed, for callbacks from other threads
+        self._alive = True
         self.thread_obj = None
 
         # Bind Ctrl+Shift+X to stop after step and Ctrl+X to stop after slice
@@ -104,6 +123,9 @@ class MainApplication(tk.Tk):
 
         # Add experiment controller
         self.experiment_controller = ExperimentController()
+        self._pending_state: Optional[ExperimentState] = None
+        self._state_lock = threading.Lock()
+        self._state_refresh_scheduled = False
 
         # Register callbacks for UI updates
         self.experiment_controller.register_callback(
@@ -205,13 +227,23 @@ class MainApplication(tk.Tk):
         Quit the program.
         This function is called when the user closes the window or selects the exit option from the menu.
         """
+        # Restore the streams first, so nothing is printed to a closed log
+        redirectors = (sys.stdout, sys.stderr)
         sys.stdout = self.original_out
         sys.stderr = self.original_err
+        for redirector in redirectors:
+            if isinstance(redirector, TextRedirector):
+                redirector.close()
         if self.thread_obj is not None and self.thread_obj.is_alive():
             self.thread_obj.raise_exception(KeyboardInterrupt)
-        self.update()
+        self.update_idletasks()
         self.destroy()
 
+    def destroy(self):
+        """Destroy the window, and stop callbacks from touching its widgets."""
+        self._alive = False
+        super().destroy()
+
     def open_help(self):
         """Open the user guide in a web browser."""
         import webbrowser
@@ -255,17 +287,11 @@ class MainApplication(tk.Tk):
 
     def test_connections(self):
         """Test the connections to the EDS/EBSD and the laser."""
-        with WaitCursor(self):
-            out_dict = {"result": None}
-            self.thread_obj = StoppableThread(
-                target=wrapper_for_output, args=(laser._device_connections, out_dict)
-            )
-            self.thread_obj.start()
-            while self.thread_obj.is_alive():
-                try:
-                    self.update()
-                except tk.TclError:
-                    return
+        self._run_in_background(
+            laser._device_connections, on_done=self._show_connection_status
+        )
+
+    def _show_connection_status(self, out_dict: Dict[str, Any]):
         status = out_dict["result"]
         messagebox.showinfo("Connection status", str(status))
 
@@ -287,13 +313,18 @@ class MainApplication(tk.Tk):
             filedialog.asksaveasfilename(
                 title="Save log file",
                 filetypes=[("Text files", "*.txt")],
-                initialdir=os.getcwd(),
+                initialdir=self._last_export_dir or os.getcwd(),
             )
         )
         if save_path == Path():
             return
+        self._last_export_dir = str(save_path.parent)
         if not save_path.suffix == ".txt":
             save_path = save_path.with_suffix(".txt")
+        # The log is written in the background, wait for the latest output
+        for redirector in (sys.stdout, sys.stderr):
+            if isinstance(redirector, TextRedirector):
+                redirector.flush()
         shutil.copy(self.terminal_log_path, save_path)
         messagebox.showinfo("Success", f"Log file saved to {save_path}")
 
@@ -308,12 +339,13 @@ class MainApplication(tk.Tk):
             filedialog.askopenfilename(
                 title="Select a configuration file",
                 filetypes=[("YAML files", ("*.yaml", "*.yml"))],
-                initialdir=os.getcwd(),
+                initialdir=self._last_config_dir or os.getcwd(),
             )
         )
         if not self.config_path.is_file():
             print("No file selected.")
             return
+        self._last_config_dir = str(self.config_path.parent)
         print(f"Imported configuration file from: {self.config_path}")
         # Clear old experiment settings when loading a new config
         self.experiment_controller.clear_experiment_settings()
@@ -323,6 +355,9 @@ class MainApplication(tk.Tk):
         self._update_experiment_info()
 
     def edit_config(self, new=False):
+        # The configurator is only loaded once it is first opened
+        from pytribeam.GUI.config_ui.App import Configurator
+
         if new:
             app = Configurator(self, theme=self.theme)
         else:
@@ -330,6 +365,8 @@ class MainApplication(tk.Tk):
         self.wait_window(app.toplevel)
         if app.clean_exit:
             self.config_path = Path(app.YAML_PATH)
+            # The file may have been rewritten within the mtime resolution
+            self._config_cache = None
             print(f"Imported configuration file from: {self.config_path}")
             # Clear old experiment settings when config is edited
             self.experiment_controller.clear_experiment_settings()
@@ -338,43 +375,85 @@ class MainApplication(tk.Tk):
             )
             self._update_experiment_info()
 
-    def validate_config(self, return_settings=False):
+    def validate_config(self):
+        """Validate the loaded configuration file in the background."""
         if self.config_path is None:
             messagebox.showerror("Error", "No configuration file loaded.")
             return
-        try:
-            with WaitCursor(self):
-                out_dict = {"result": None, "error": False}
-                self.thread_obj = StoppableThread(
-                    target=wrapper_for_output,
-                    args=(workflow.pre_flight_check, out_dict, self.config_path),
-                )
-                self.thread_obj.start()
-                while self.thread_obj.is_alive():
-                    try:
-                        self.update()
-                    except tk.TclError:
-                        return
-                    except Exception as e:
-                        break
-                if out_dict["error"]:
-                    raise Exception(out_dict["error"])
-            experiment_settings = out_dict["result"]
-            self.control_panel.set_validation_status(
-                True, "Configuration file is valid"
-            )
-            if return_settings:
-                return experiment_settings
-            else:
-                return
-        except Exception as e:
+        self._run_in_background(
+            workflow.pre_flight_check,
+            (self.config_path,),
+            on_done=self._on_config_validated,
+        )
+
+    def _on_config_validated(self, out_dict: Dict[str, Any]):
+        if out_dict["error"]:
             messagebox.showerror(
-                "Invalid config file", f"The provided config file is invalid:\n{e}"
+                "Invalid config file",
+                f"The provided config file is invalid:\n{out_dict['error']}",
             )
             self.control_panel.set_validation_status(
                 False, "Configuration file is invalid"
             )
             return
+        self.control_panel.set_validation_status(True, "Configuration file is valid")
+        if self.experiment_controller.state.is_running:
+            # Keep the running experiment's settings and microscope connection
+            return
+        # Starting the experiment right after this reuses these settings
+        self.experiment_controller.set_config_path(self.config_path)
+        self.experiment_controller.set_validated_settings(out_dict["result"])
+
+    # -------- Background tasks -------- #
+
+    def _run_in_background(
+        self,
+        func: Callable,
+        args: Tuple = (),
+        on_done: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """Run ``func(*args)`` in a worker thread without blocking the GUI.
+
+        Tk keeps running its own event loop while the thread works, and checks on
+        it every POLL_INTERVAL_MS instead of spinning on ``update()``. Once the
+        thread has finished, ``on_done`` is called on the Tk thread with a dict
+        holding the "result" of the call and any "error" it raised.
+
+        Only one task runs at a time, so a second click on a button while its
+        task is still running is ignored.
+        """
+        if self.thread_obj is not None and self.thread_obj.is_alive():
+            print("-----> Please wait for the current task to finish")
+            return
+        out_dict = {"result": None, "error": False}
+        self.config(cursor="wait")
+        self.thread_obj = StoppableThread(
+            target=wrapper_for_output, args=(func, out_dict, *args)
+        )
+        self.thread_obj.start()
+        self.after(
+            self.POLL_INTERVAL_MS,
+            self._poll_background,
+            self.thread_obj,
+            out_dict,
+            on_done,
+        )
+
+    def _poll_background(
+        self,
+        thread: StoppableThread,
+        out_dict: Dict[str, Any],
+        on_done: Optional[Callable[[Dict[str, Any]], None]],
+    ):
+        """Check whether a background task has finished, see _run_in_background."""
+        if thread.is_alive():
+            self.after(
+                self.POLL_INTERVAL_MS, self._poll_background, thread, out_dict, on_done
+            )
+            return
+        self.config(cursor="")
+        if on_done is not None:
+            on_done(out_dict)
 
     # -------- Update GUI functions -------- #
 
@@ -383,12 +462,7 @@ class MainApplication(tk.Tk):
         if self.config_path is None:
             return
         try:
-            self.yml_version = utilities.yml_version(self.config_path)
-            db = utilities.yml_to_dict(
-                yml_path_file=self.config_path,
-                version=self.yml_version,
-                required_keys=("general", "steps"),
-            )
+            self.yml_version, db = self._read_config()
             num_steps = db["general"]["step_count"]
             max_slice_num = db["general"]["max_slice_num"]
             slice_thickness = db["general"]["slice_thickness_um"]
@@ -408,6 +482,25 @@ class MainApplication(tk.Tk):
         }
         self.control_panel.update_experiment_info(config_info)
 
+    def _read_config(self) -> Tuple[float, Dict[str, Any]]:
+        """Return the version and contents of the current configuration file.
+
+        The parsed file is reused until the file changes on disk, so refreshing
+        the experiment info (e.g. on a theme change) doesn't parse it again.
+        """
+        stat = self.config_path.stat()
+        key = (str(self.config_path), stat.st_mtime_ns, stat.st_size)
+        if self._config_cache is not None and self._config_cache[0] == key:
+            return self._config_cache[1], self._config_cache[2]
+        yml_version = utilities.yml_version(self.config_path)
+        db = utilities.yml_to_dict(
+            yml_path_file=self.config_path,
+            version=yml_version,
+            required_keys=("general", "steps"),
+        )
+        self._config_cache = (key, yml_version, db)
+        return yml_version, db
+
     def _update_slice_info(self, slice_number):
         """Update the slice information in the GUI."""
         self.status_panel.current_slice_var.set(slice_number)
@@ -427,45 +520,33 @@ class MainApplication(tk.Tk):
         buttons="normal",
     ):
         """Update the experiment control buttons."""
-        start_kwards = {
-            "normal": {"state": "normal", "bg": self.theme.bg},
-            "disabled": {
-                "state": "disabled",
-                "bg": self.theme.green,
-                "disabledforeground": self.theme.bg,
-            },
-        }
-        step_kwargs = {
-            "normal": {"state": "normal", "bg": self.theme.bg},
-            "disabled": {
-                "state": "disabled",
-                "bg": self.theme.accent3,
-                "disabledforeground": self.theme.bg,
-            },
-        }
-        slice_kwargs = {
-            "normal": {"state": "normal", "bg": self.theme.bg},
-            "disabled": {
-                "state": "disabled",
-                "bg": self.theme.accent3,
-                "disabledforeground": self.theme.bg,
-            },
-        }
-        hard_kwargs = {
-            "normal": {"state": "normal", "bg": self.theme.bg},
-            "disabled": {
-                "state": "disabled",
-                "bg": self.theme.accent3,
-                "disabledforeground": self.theme.bg,
-            },
-        }
-        self.control_panel.start_btn.config(**start_kwards[start])
-        self.control_panel.stop_step_btn.config(**step_kwargs[step])
-        self.control_panel.stop_slice_btn.config(**slice_kwargs[slice])
-        self.control_panel.stop_now_btn.config(**hard_kwargs[hard])
+        styles = self._button_styles()
+        for (attr, _), state in zip(
+            self.EXP_CONTROL_BUTTONS, (start, step, slice, hard)
+        ):
+            getattr(self.control_panel, attr).config(**styles[attr][state])
         # Note: Config buttons are not exposed by ControlPanel,
         # so we'll skip updating them for now
-        self.update_idletasks()
+
+    def _button_styles(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """Return the config of each experiment control button for each state.
+
+        Built once per theme, see EXP_CONTROL_BUTTONS.
+        """
+        if self._button_styles_theme is not self.theme:
+            self._button_styles_cache = {
+                attr: {
+                    "normal": {"state": "normal", "bg": self.theme.bg},
+                    "disabled": {
+                        "state": "disabled",
+                        "bg": getattr(self.theme, disabled_bg),
+                        "disabledforeground": self.theme.bg,
+                    },
+                }
+                for attr, disabled_bg in self.EXP_CONTROL_BUTTONS
+            }
+            self._button_styles_theme = self.theme
+        return self._button_styles_cache
 
     def _reset_starting_positions(self):
         """Reset the starting slice and step to defaults."""
@@ -512,15 +593,36 @@ class MainApplication(tk.Tk):
     # -------- Callbacks for experiment controller -------- #
 
     def _on_experiment_state_changed(self, state: ExperimentState):
-        """Handle state updates from controller."""
-        # Update status panel with new state
-        self.status_panel.update_state(state)
+        """Handle state updates from controller.
 
-        # Force GUI update
+        The controller reports several changes per step from the experiment
+        thread, so only the latest state is kept and the status panel is
+        refreshed from it at most every STATUS_INTERVAL_MS on the Tk thread.
+        A copy is kept, as the controller goes on changing its state while the
+        panel is being refreshed.
+        """
+        if not self._alive:
+            return
+        state = copy.copy(state)
+        with self._state_lock:
+            self._pending_state = state
+            if self._state_refresh_scheduled:
+                return
+            self._state_refresh_scheduled = True
         try:
-            self.update_idletasks()
-        except tk.TclError:
-            pass
+            self.after(self.STATUS_INTERVAL_MS, self._refresh_status)
+        except (tk.TclError, RuntimeError):
+            # Window closed after the check above
+            with self._state_lock:
+                self._state_refresh_scheduled = False
+
+    def _refresh_status(self):
+        """Show the latest experiment state in the status panel."""
+        with self._state_lock:
+            state = self._pending_state
+            self._state_refresh_scheduled = False
+        if self._alive:
+            self.status_panel.update_state(state)
 
     def _on_experiment_started(self, settings, start_slice, start_step):
         """Handle experiment start."""
@@ -572,16 +674,6 @@ class MainApplication(tk.Tk):
         )
 
 
-@contextlib.contextmanager
-def WaitCursor(root):
-    root.config(cursor="wait")
-    root.update()
-    try:
-        yield root
-    finally:
-        root.config(cursor="")
-
-
 def step_call_wrapper(out_dict, slice_number, step_index, experiment_settings):
     """
     A wrapper function to call the step function in a thread while also being able to catch a KeyboardInterrupt.
@@ -602,7 +694,6 @@ def step_call_wrapper(out_dict, slice_number, step_index, experiment_settings):
             f"Unexpected error in step {step_index} of slice {slice_number}: {e.__class__} {e}"
         )
         app_config = AppConfig.from_env()
-        app_config.ensure_directories()
         err_path = app_config.get_error_log_path()
         with open(err_path, "w") as f:
             f.write(f"Exception: {type(e).__name__} - {e}\n")
@@ -5,7 +5,7 @@ separated from the GUI presentation layer.
 """
 
 import time
-import datetime
+import threading
 import traceback
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,6 +17,16 @@ from pytribeam.GUI.common import AppConfig, StoppableThread
 from pytribeam.GUI.common.threading_utils import generate_escape_keypress
 
 
+def _format_duration(seconds: int) -> str:
+    """Format a number of seconds as H:MM:SS, e.g. 3725 -> "1:02:05".
+
+    Hours are not wrapped into days, so 90000 -> "25:00:00".
+    """
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
 @dataclass
 class ExperimentState:
     """Represents the current state of an experiment.
@@ -61,8 +71,20 @@ class ExperimentController:
     Attributes:
         config_path: Path to experiment configuration file
         state: Current experiment state
+        stop_event: Set when an immediate stop is requested, for the
+            experiment to stop at the next opportunity
     """
 
+    # Seconds a hard stop waits for the experiment thread to stop on its own
+    # before interrupting it with an exception
+    HARD_STOP_GRACE_S = 5.0
+    # Rest of the warning shown when EBSD and/or EDS are not enabled
+    DETECTOR_WARNING = (
+        ", you will not have access to safety checking and these modalities "
+        "during data collection. Please ensure these detectors are retracted "
+        "before proceeding."
+    )
+
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize experiment controller.
 
@@ -73,8 +95,16 @@ class ExperimentController:
         self.state = ExperimentState()
         self._callbacks: Dict[str, Callable] = {}
         self._thread: Optional[StoppableThread] = None
-        self._slice_times: List[float] = []
+        # Total seconds and number of the slices timed so far, for the average
+        self._slice_time_total = 0.0
+        self._slice_count = 0
+        # Whole seconds of the average slice time and remaining time last shown
+        self._last_timing: Optional[Tuple[int, int]] = None
         self.experiment_settings: Optional[tbt.ExperimentSettings] = None
+        # (path, mtime, size) of the config file experiment_settings were
+        # validated from, if they can be reused to start the experiment
+        self._validated_key: Optional[Tuple[str, int, int]] = None
+        self.stop_event = threading.Event()
 
     def clear_experiment_settings(self):
         """Clear cached experiment settings and release resources.
@@ -98,6 +128,34 @@ class ExperimentController:
 
             # Clear the reference to allow garbage collection
             self.experiment_settings = None
+        self._validated_key = None
+
+    def set_validated_settings(self, experiment_settings: tbt.ExperimentSettings):
+        """Keep settings from a pre-flight check of the current config file.
+
+        The next experiment reuses them instead of running the pre-flight
+        check again, as long as the config file has not changed since. Does
+        nothing while an experiment is running.
+
+        Args:
+            experiment_settings: Settings returned by ``workflow.pre_flight_check``
+        """
+        if self.state.is_running:
+            # The running experiment still uses the current settings
+            return
+        self.clear_experiment_settings()
+        self.experiment_settings = experiment_settings
+        self._validated_key = self._config_key()
+
+    def _config_key(self) -> Optional[Tuple[str, int, int]]:
+        """Return (path, mtime, size) of the config file, or None if it is missing."""
+        if self.config_path is None:
+            return None
+        try:
+            stat = Path(self.config_path).stat()
+        except OSError:
+            return None
+        return (str(self.config_path), stat.st_mtime_ns, stat.st_size)
 
     def set_config_path(self, path: Path):
         """Set or update configuration file path.
@@ -136,12 +194,33 @@ class ExperimentController:
     ) -> Tuple[bool, Optional[tbt.ExperimentSettings], Optional[str]]:
         """Validate the current configuration file.
 
+        Settings kept with ``set_validated_settings`` are reused if the file
+        hasn't changed since, instead of running the pre-flight check again.
+
         Returns:
             Tuple of (is_valid, experiment_settings, error_message)
         """
         if self.config_path is None:
             return False, None, "No configuration file loaded"
 
+        key = self._config_key()
+        if (
+            self.experiment_settings is not None
+            and key is not None
+            and key == self._validated_key
+        ):
+            # The file was just validated, so skip the pre-flight check
+            validated_settings = self.experiment_settings
+            self._validated_key = None
+            try:
+                experiment_settings = workflow.setup_experiment(
+                    self.config_path, experiment_settings=validated_settings
+                )
+                return True, experiment_settings, None
+            except Exception as e:
+                self.clear_experiment_settings()
+                return False, None, f"Validation failed: {e}"
+
         # Clear old experiment settings before creating new ones
         # This ensures old microscope connections are released
         self.clear_experiment_settings()
@@ -179,6 +258,7 @@ class ExperimentController:
         self.experiment_settings = experiment_settings
 
         # Reset stop flags
+        self.stop_event.clear()
         self.state = ExperimentState(
             total_slices=experiment_settings.general_settings.max_slice_number,
             total_steps=experiment_settings.general_settings.step_count,
@@ -217,24 +297,19 @@ class ExperimentController:
         Args:
             experiment_settings: Validated experiment settings
         """
-        # Check if EBSD and EDS are enabled
-        if not experiment_settings.enable_EBSD or not experiment_settings.enable_EDS:
-            if experiment_settings.enable_EBSD:
-                message_part1 = "EDS is not enabled"
-            elif experiment_settings.enable_EDS:
-                message_part1 = "EBSD is not enabled"
-            else:
-                message_part1 = "EBSD and EDS are not enabled"
-
-            message_part2 = (
-                ", you will not have access to safety checking and these modalities "
-                "during data collection. Please ensure these detectors are retracted "
-                "before proceeding."
-            )
-            warning_message = message_part1 + message_part2
+        enable_EBSD = experiment_settings.enable_EBSD
+        enable_EDS = experiment_settings.enable_EDS
+        if enable_EBSD and enable_EDS:
+            return
+        if not enable_EBSD and not enable_EDS:
+            disabled = "EBSD and EDS are not enabled"
+        elif not enable_EBSD:
+            disabled = "EBSD is not enabled"
+        else:
+            disabled = "EDS is not enabled"
 
-            # Notify UI to show warning
-            self._notify("detector_warning", warning_message)
+        # Notify UI to show warning
+        self._notify("detector_warning", disabled + self.DETECTOR_WARNING)
 
     def _run_experiment_loop(
         self,
@@ -254,32 +329,34 @@ class ExperimentController:
             starting_step_idx: Starting step index
             step_names: List of step names
         """
-        self._slice_times = []
+        self._slice_time_total = 0.0
+        self._slice_count = 0
+        self._last_timing = None
         ending_slice = self.state.total_slices
         num_steps = self.state.total_steps
 
         try:
             for i in range(starting_slice, ending_slice + 1):
-                if self.state.should_stop_now:
+                if self.stop_event.is_set():
                     raise KeyboardInterrupt
 
                 # Track slice start time
-                slice_start = time.time()
-                count_slice_for_time = True
+                slice_start = time.monotonic()
+                # Skip steps if starting mid-slice, and leave that slice out
+                # of the timing
+                first_step = starting_step_idx if i == starting_slice else 0
+                count_slice_for_time = first_step == 0
                 self.state.current_slice = i
                 self._notify("state_changed", self.state)
 
-                for j in range(num_steps):
-                    # Skip steps if starting mid-slice
-                    if i == starting_slice and j < starting_step_idx:
-                        count_slice_for_time = False
-                        continue
-
-                    if self.state.should_stop_now:
+                for j, step_name in enumerate(
+                    step_names[first_step:num_steps], start=first_step
+                ):
+                    if self.stop_event.is_set():
                         raise KeyboardInterrupt
 
                     # Update current step
-                    self.state.current_step = step_names[j]
+                    self.state.current_step = step_name
                     self._notify("state_changed", self.state)
 
                     # Execute step
@@ -304,9 +381,10 @@ class ExperimentController:
                     break
 
                 # Update timing stats
-                slice_end = time.time()
+                slice_end = time.monotonic()
                 if count_slice_for_time:
-                    self._slice_times.append(slice_end - slice_start)
+                    self._slice_time_total += slice_end - slice_start
+                    self._slice_count += 1
                 self._update_timing_stats(i, ending_slice)
 
         except KeyboardInterrupt:
@@ -366,7 +444,6 @@ class ExperimentController:
             step_index: Step where error occurred
         """
         app_config = AppConfig.from_env()
-        app_config.ensure_directories()
         err_path = app_config.get_error_log_path()
 
         with open(err_path, "w") as f:
@@ -381,6 +458,8 @@ class ExperimentController:
     ):
         """Update progress percentage.
 
+        Listeners are only notified when the whole percentage changes.
+
         Args:
             slice_num: Current slice number
             step_num: Current step number
@@ -389,7 +468,10 @@ class ExperimentController:
         """
         completed_steps = (slice_num - 1) * total_steps + step_num
         total_work = total_slices * total_steps
-        self.state.progress_percent = int((completed_steps / total_work) * 100)
+        progress_percent = completed_steps * 100 // total_work
+        if progress_percent == self.state.progress_percent:
+            return
+        self.state.progress_percent = progress_percent
         self._notify("state_changed", self.state)
 
     def _update_timing_stats(self, current_slice: int, total_slices: int):
@@ -399,17 +481,20 @@ class ExperimentController:
             current_slice: Current slice number
             total_slices: Total number of slices
         """
-        if not self._slice_times:
+        if not self._slice_count:
             return
 
-        avg_time = sum(self._slice_times) / len(self._slice_times)
+        avg_time = self._slice_time_total / self._slice_count
         remaining_slices = total_slices - current_slice
         remaining_time = avg_time * remaining_slices
 
-        self.state.avg_slice_time_str = str(datetime.timedelta(seconds=int(avg_time)))
-        self.state.remaining_time_str = str(
-            datetime.timedelta(seconds=int(remaining_time))
-        )
+        # Only format the times again when the whole seconds change
+        timing = (int(avg_time), int(remaining_time))
+        if timing == self._last_timing:
+            return
+        self._last_timing = timing
+        self.state.avg_slice_time_str = _format_duration(timing[0])
+        self.state.remaining_time_str = _format_duration(timing[1])
         self._notify("state_changed", self.state)
 
     def _cleanup_experiment(
@@ -498,6 +583,7 @@ class ExperimentController:
             return
 
         self.state.should_stop_now = True
+        self.stop_event.set()
         self._notify("stop_requested", "now")
         print("-----> Experiment stopped immediately by user")
 
@@ -507,15 +593,31 @@ class ExperimentController:
         except Exception as e:
             print(f"Warning: Failed to send escape keypress: {e}")
 
-        # If there's a running thread, interrupt it
+        # The experiment loop checks stop_event between steps. Only interrupt
+        # the thread if it hasn't stopped by the end of the grace period, which
+        # is waited out in the background so the caller isn't blocked.
         if self._thread and self._thread.is_alive():
-            try:
-                count = 0
-                while self._thread.is_alive():
-                    self._thread.raise_exception(KeyboardInterrupt)
-                    time.sleep(0.1)
-                    count += 1
-                    if count >= 10:
-                        break
-            except Exception as e:
-                print(f"Warning: Failed to interrupt thread: {e}")
+            threading.Thread(
+                target=self._interrupt_if_running,
+                args=(self._thread,),
+                name="HardStopThread",
+                daemon=True,
+            ).start()
+
+    def _interrupt_if_running(self, thread: StoppableThread):
+        """Interrupt the experiment thread if it outlives the hard stop grace period.
+
+        Args:
+            thread: The experiment thread
+        """
+        thread.join(self.HARD_STOP_GRACE_S)
+        try:
+            count = 0
+            while thread.is_alive():
+                thread.raise_exception(KeyboardInterrupt)
+                time.sleep(0.1)
+                count += 1
+                if count >= 10:
+                    break
+        except Exception as e:
+            print(f"Warning: Failed to interrupt thread: {e}")
@@ -4,8 +4,12 @@ This module contains UI panels and widgets that can be composed
 to build the main application window.
 """
 
+import functools
 import tkinter as tk
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Tuple
 from tkinter import messagebox
 from PIL import Image, ImageTk
 
@@ -14,6 +18,38 @@ from pytribeam.GUI.common import AppResources
 from pytribeam.GUI.runner_util.experiment_controller import ExperimentState
 
 
+@functools.lru_cache(maxsize=None)
+def _load_logo(path: Path) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Decode a logo and shrink it to a third of its size.
+
+    The control panel is rebuilt on every theme change, so the decoded image
+    is cached rather than read from disk and resampled each time.
+
+    Args:
+        path: Path to the logo image
+
+    Returns:
+        Tuple of (image, size the image was shrunk to fit)
+    """
+    image = Image.open(path)
+    image_size = (image.size[0] // 3, image.size[1] // 3)
+    image.thumbnail(image_size, Image.LANCZOS)
+    return image, image_size
+
+
+# Tk images of the logos for each root window. A PhotoImage belongs to the Tk
+# interpreter it was made in, so they are kept per root, and dropped with it.
+_logo_photos: "weakref.WeakKeyDictionary[tk.Tk, Dict[Path, ImageTk.PhotoImage]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _logo_pool() -> ThreadPoolExecutor:
+    """Worker that decodes logos off the Tk thread, created on first use."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="LogoLoader")
+
+
 class ControlPanel(tk.Frame):
     """Control panel with experiment settings and action buttons.
 
@@ -35,6 +71,27 @@ class ControlPanel(tk.Frame):
         on_stop_now: Callback for immediate stop
     """
 
+    # Experiment info labels as (attribute, initial text, font, columnspan)
+    INFO_LABELS = (
+        ("total_slices_label", "Total number of slices: -", ctk.FONT, 1),
+        ("total_steps_label", "Number of steps per slice: -", ctk.FONT, 1),
+        ("slice_thickness_label", "Slice thickness: -", ctk.FONT, 1),
+        ("config_file_label", "No configuration file loaded", ctk.FONT_ITALIC, 2),
+        ("exp_dir_label", "Exp dir: -", ctk.FONT_ITALIC, 2),
+        ("valid_status_label", "...", ctk.FONT_ITALIC, 2),
+    )
+
+    # Config file buttons as (text, callback attribute, row, tooltip)
+    CONFIG_BUTTONS = (
+        ("Create", "on_new_config", 0, "Create a new configuration file"),
+        ("Load", "on_load_config", 1, "Load an existing configuration file"),
+        ("Edit", "on_edit_config", 2, "Edit the current configuration file"),
+        ("Validate", "on_validate_config", 5, "Validate configuration file"),
+    )
+
+    # How often to check whether the logo has been decoded
+    LOGO_POLL_MS = 20
+
     def __init__(self, parent, theme, resources: AppResources, **kwargs):
         """Initialize control panel.
 
@@ -64,25 +121,37 @@ class ControlPanel(tk.Frame):
         # Variables for UI state
         self.starting_slice_var = tk.IntVar(value=1)
         self.starting_step_var = tk.StringVar(value="-")
+        self._logo_after_id = None
 
         self._create_widgets()
 
     def _create_widgets(self):
         """Create all widgets in the control panel."""
-        # Logo
-        image = Image.open(self.resources.logo_dark_path)
-        image_size = (image.size[0] // 3, image.size[1] // 3)
-        image.thumbnail(image_size, Image.ANTIALIAS)
-        self.logo = ImageTk.PhotoImage(image)
+        # Logo, decoded in the background. Only the header is read here, to
+        # size a blank placeholder until the image is ready. Once shown, the
+        # image is reused when the panel is rebuilt (e.g. on a theme change).
+        logo_path = self.resources.logo_dark_path
+        photo = _logo_photos.get(self._root(), {}).get(logo_path)
+        if photo is None:
+            future = _logo_pool().submit(_load_logo, logo_path)
+            with Image.open(logo_path) as header:
+                image_size = (header.size[0] // 3, header.size[1] // 3)
+            self.logo = tk.PhotoImage(width=image_size[0], height=image_size[1])
+        else:
+            future = None
+            image_size = (photo.width(), photo.height())
+            self.logo = photo
 
-        logo_label = tk.Label(
+        self.logo_label = tk.Label(
             self,
             image=self.logo,
             bg=self.theme.bg,
             width=image_size[0],
             height=image_size[1],
         )
-        logo_label.grid(row=0, column=0, columnspan=4)
+        self.logo_label.grid(row=0, column=0, columnspan=4)
+        if future is not None:
+            self._show_logo(future, logo_path)
 
         # Experiment info frame
         self._create_experiment_info_frame()
@@ -93,6 +162,39 @@ class ControlPanel(tk.Frame):
         # Control buttons
         self._create_control_buttons()
 
+    def _show_logo(self, future: Future, logo_path: Path):
+        """Install the decoded logo once it is ready, checking back until then.
+
+        PhotoImage has to be created on the Tk thread, so only the decoding
+        happens in the background.
+
+        Args:
+            future: Future for the result of _load_logo
+            logo_path: Path the logo was loaded from
+        """
+        if not future.done():
+            self._logo_after_id = self.after(
+                self.LOGO_POLL_MS, self._show_logo, future, logo_path
+            )
+            return
+        self._logo_after_id = None
+        try:
+            image, _ = future.result()
+        except Exception as e:
+            print(f"Warning: Failed to load logo: {e}")
+            return
+        root = self._root()
+        self.logo = ImageTk.PhotoImage(image, master=root)
+        _logo_photos.setdefault(root, {})[logo_path] = self.logo
+        self.logo_label.config(image=self.logo)
+
+    def destroy(self):
+        """Destroy the panel, cancelling any pending logo check."""
+        if self._logo_after_id is not None:
+            self.after_cancel(self._logo_after_id)
+            self._logo_after_id = None
+        super().destroy()
+
     def _create_experiment_info_frame(self):
         """Create experiment information display."""
         info_frame = tk.LabelFrame(
@@ -107,119 +209,44 @@ class ControlPanel(tk.Frame):
         info_frame.columnconfigure(1, weight=1)
         info_frame.rowconfigure([0, 1, 2, 3, 4, 5], weight=1)
 
-        # Labels
-        self.total_slices_label = tk.Label(
-            info_frame,
-            text="Total number of slices: -",
-            font=ctk.FONT,
-            bg=self.theme.bg,
-            fg=self.theme.fg,
-            anchor="w",
-        )
-        self.total_slices_label.grid(row=0, column=0, sticky="nsew", pady=2, padx=2)
-
-        self.total_steps_label = tk.Label(
-            info_frame,
-            text="Number of steps per slice: -",
-            font=ctk.FONT,
-            bg=self.theme.bg,
-            fg=self.theme.fg,
-            anchor="w",
-        )
-        self.total_steps_label.grid(row=1, column=0, sticky="nsew", pady=2, padx=2)
-
-        self.slice_thickness_label = tk.Label(
-            info_frame,
-            text="Slice thickness: -",
-            font=ctk.FONT,
-            bg=self.theme.bg,
-            fg=self.theme.fg,
-            anchor="w",
-        )
-        self.slice_thickness_label.grid(row=2, column=0, sticky="nsew", pady=2, padx=2)
-
-        self.config_file_label = tk.Label(
-            info_frame,
-            text="No configuration file loaded",
-            font=ctk.FONT_ITALIC,
-            bg=self.theme.bg,
-            fg=self.theme.fg,
-            anchor="w",
-        )
-        self.config_file_label.grid(
-            row=3, column=0, columnspan=2, sticky="nsew", pady=2, padx=2
-        )
-
-        self.exp_dir_label = tk.Label(
-            info_frame,
-            text="Exp dir: -",
-            font=ctk.FONT_ITALIC,
-            bg=self.theme.bg,
-            fg=self.theme.fg,
-            anchor="w",
-        )
-        self.exp_dir_label.grid(
-            row=4, column=0, columnspan=2, sticky="nsew", pady=2, padx=2
-        )
-
-        self.valid_status_label = tk.Label(
-            info_frame,
-            text="...",
-            font=ctk.FONT_ITALIC,
-            bg=self.theme.bg,
-            fg=self.theme.fg,
-            anchor="w",
-        )
-        self.valid_status_label.grid(
-            row=5, column=0, columnspan=2, sticky="nsew", pady=2, padx=2
-        )
+        # Labels, one per row
+        for row, (attr, text, font, columnspan) in enumerate(self.INFO_LABELS):
+            label = tk.Label(
+                info_frame,
+                text=text,
+                font=font,
+                bg=self.theme.bg,
+                fg=self.theme.fg,
+                anchor="w",
+            )
+            label.grid(
+                row=row,
+                column=0,
+                columnspan=columnspan,
+                sticky="nsew",
+                pady=2,
+                padx=2,
+            )
+            setattr(self, attr, label)
 
         # Buttons
-        create_btn = tk.Button(
-            info_frame,
-            text="Create",
-            font=ctk.FONT,
-            command=lambda: self.on_new_config() if self.on_new_config else None,
-            bg=self.theme.bg_off,
-            fg=self.theme.fg,
-        )
-        create_btn.grid(row=0, column=1, sticky="nsew", pady=2, padx=2)
-        ctk.tooltip(create_btn, "Create a new configuration file")
-
-        load_btn = tk.Button(
-            info_frame,
-            text="Load",
-            font=ctk.FONT,
-            command=lambda: self.on_load_config() if self.on_load_config else None,
-            bg=self.theme.bg_off,
-            fg=self.theme.fg,
-        )
-        load_btn.grid(row=1, column=1, sticky="nsew", pady=2, padx=2)
-        ctk.tooltip(load_btn, "Load an existing configuration file")
-
-        edit_btn = tk.Button(
-            info_frame,
-            text="Edit",
-            font=ctk.FONT,
-            command=lambda: self.on_edit_config() if self.on_edit_config else None,
-            bg=self.theme.bg_off,
-            fg=self.theme.fg,
-        )
-        edit_btn.grid(row=2, column=1, sticky="nsew", pady=2, padx=2)
-        ctk.tooltip(edit_btn, "Edit the current configuration file")
+        for text, callback, row, tip in self.CONFIG_BUTTONS:
+            button = tk.Button(
+                info_frame,
+                text=text,
+                font=ctk.FONT,
+                command=lambda callback=callback: self._run_callback(callback),
+                bg=self.theme.bg_off,
+                fg=self.theme.fg,
+            )
+            button.grid(row=row, column=1, sticky="nsew", pady=2, padx=2)
+            ctk.tooltip(button, tip)
 
-        validate_btn = tk.Button(
-            info_frame,
-            text="Validate",
-            font=ctk.FONT,
-            command=lambda: (
-                self.on_validate_config() if self.on_validate_config else None
-            ),
-            bg=self.theme.bg_off,
-            fg=self.theme.fg,
-        )
-        validate_btn.grid(row=5, column=1, sticky="nsew", pady=2, padx=2)
-        ctk.tooltip(validate_btn, "Validate configuration file")
+    def _run_callback(self, name: str):
+        """Call the callback stored in attribute ``name``, if one has been set."""
+        callback = getattr(self, name)
+        if callback:
+            callback()
 
     def _create_starting_position_widgets(self):
         """Create slice and step starting position selectors."""
@@ -348,19 +375,25 @@ class ControlPanel(tk.Frame):
             config_info: Dictionary with keys: total_slices, total_steps,
                         slice_thickness, config_path, exp_dir, step_names
         """
-        self.total_slices_label.config(
-            text=f"Total number of slices: {config_info.get('total_slices', '-')}"
+        self._set_label(
+            self.total_slices_label,
+            text=f"Total number of slices: {config_info.get('total_slices', '-')}",
         )
-        self.total_steps_label.config(
-            text=f"Number of steps per slice: {config_info.get('total_steps', '-')}"
+        self._set_label(
+            self.total_steps_label,
+            text=f"Number of steps per slice: {config_info.get('total_steps', '-')}",
         )
-        self.slice_thickness_label.config(
-            text=f"Slice thickness: {config_info.get('slice_thickness', '-')}"
+        self._set_label(
+            self.slice_thickness_label,
+            text=f"Slice thickness: {config_info.get('slice_thickness', '-')}",
         )
-        self.config_file_label.config(
-            text=f"Config: {config_info.get('config_path', 'No file loaded')}"
+        self._set_label(
+            self.config_file_label,
+            text=f"Config: {config_info.get('config_path', 'No file loaded')}",
+        )
+        self._set_label(
+            self.exp_dir_label, text=f"Exp dir: {config_info.get('exp_dir', '-')}"
         )
-        self.exp_dir_label.config(text=f"Exp dir: {config_info.get('exp_dir', '-')}")
 
         # Update starting position controls
         if "total_slices" in config_info and config_info["total_slices"] != "-":
@@ -381,14 +414,35 @@ class ControlPanel(tk.Frame):
             message: Status message to display
         """
         if is_valid:
-            self.valid_status_label.config(
-                text=message or "Configuration file is valid", fg=self.theme.green
+            self._set_label(
+                self.valid_status_label,
+                text=message or "Configuration file is valid",
+                fg=self.theme.green,
             )
         else:
-            self.valid_status_label.config(
-                text=message or "Configuration file is invalid", fg=self.theme.red
+            self._set_label(
+                self.valid_status_label,
+                text=message or "Configuration file is invalid",
+                fg=self.theme.red,
             )
 
+    @staticmethod
+    def _set_label(label: tk.Label, **options):
+        """Configure only the label options that differ from what it shows.
+
+        Reloading or revalidating the same config mostly sets the same text
+        again, and each config() call makes Tk lay the label out again.
+
+        Args:
+            label: Label to update
+            **options: Label options to set, e.g. text and fg
+        """
+        changed = {
+            key: value for key, value in options.items() if label.cget(key) != value
+        }
+        if changed:
+            label.config(**changed)
+
     def set_buttons_enabled(self, start: bool = True, stop_controls: bool = False):
         """Enable/disable control buttons.
 
@@ -416,6 +470,15 @@ class StatusPanel(tk.Frame):
         None (updates via update_state method)
     """
 
+    # Fields shown from left to right, as (caption, variable attribute,
+    # ExperimentState attribute)
+    FIELDS = (
+        ("Current step", "current_step_var", "current_step"),
+        ("Current slice", "current_slice_var", "current_slice"),
+        ("Average slice time", "slice_time_var", "avg_slice_time_str"),
+        ("Remaining duration", "time_left_var", "remaining_time_str"),
+    )
+
     def __init__(self, parent, theme, **kwargs):
         """Initialize status panel.
 
@@ -436,86 +499,32 @@ class StatusPanel(tk.Frame):
         self.current_slice_var = tk.StringVar(value="-")
         self.slice_time_var = tk.StringVar(value="-")
         self.time_left_var = tk.StringVar(value="-")
+        # Last value shown for each variable (and the progress bar)
+        self._shown = {}
 
         self._create_widgets()
 
     def _create_widgets(self):
         """Create all widgets in status panel."""
-        # Current step
-        tk.Label(
-            self,
-            text="Current step",
-            font=ctk.FONT_ITALIC,
-            bg=self.theme.bg,
-            fg=self.theme.fg,
-            anchor="e",
-        ).grid(row=0, column=0, sticky="nsew", pady=5, padx=5)
-
-        tk.Label(
-            self,
-            textvariable=self.current_step_var,
-            font=ctk.FONT_BOLD,
-            bg=self.theme.bg,
-            fg=self.theme.accent2,
-            anchor="w",
-        ).grid(row=0, column=1, sticky="nsew", pady=5, padx=5)
-
-        # Current slice
-        tk.Label(
-            self,
-            text="Current slice",
-            font=ctk.FONT_ITALIC,
-            bg=self.theme.bg,
-            fg=self.theme.fg,
-            anchor="e",
-        ).grid(row=0, column=2, sticky="nsew", pady=5, padx=5)
-
-        tk.Label(
-            self,
-            textvariable=self.current_slice_var,
-            font=ctk.FONT_BOLD,
-            bg=self.theme.bg,
-            fg=self.theme.accent2,
-            anchor="w",
-        ).grid(row=0, column=3, sticky="nsew", pady=5, padx=5)
-
-        # Average slice time
-        tk.Label(
-            self,
-            text="Average slice time",
-            font=ctk.FONT_ITALIC,
-            bg=self.theme.bg,
-            fg=self.theme.fg,
-            anchor="e",
-        ).grid(row=0, column=4, sticky="nsew", pady=5, padx=5)
-
-        tk.Label(
-            self,
-            textvariable=self.slice_time_var,
-            font=ctk.FONT_BOLD,
-            bg=self.theme.bg,
-            fg=self.theme.accent2,
-            anchor="w",
-        ).grid(row=0, column=5, sticky="nsew", pady=5, padx=5)
-
-        # Time left
-        tk.Label(
-            self,
-            text="Remaining duration",
-            font=ctk.FONT_ITALIC,
-            bg=self.theme.bg,
-            fg=self.theme.fg,
-            anchor="e",
-        ).grid(row=0, column=6, sticky="nsew", pady=5, padx=5)
-
-        tk.Label(
-            self,
-            textvariable=self.time_left_var,
-            font=ctk.FONT_BOLD,
-            bg=self.theme.bg,
-            fg=self.theme.accent2,
-            anchor="w",
-        ).grid(row=0, column=7, sticky="nsew", pady=5, padx=5)
+        # Caption and value side by side for each field
+        for i, (caption, var_name, _) in enumerate(self.FIELDS):
+            tk.Label(
+                self,
+                text=caption,
+                font=ctk.FONT_ITALIC,
+                bg=self.theme.bg,
+                fg=self.theme.fg,
+                anchor="e",
+            ).grid(row=0, column=2 * i, sticky="nsew", pady=5, padx=5)
+
+            tk.Label(
+                self,
+                textvariable=getattr(self, var_name),
+                font=ctk.FONT_BOLD,
+                bg=self.theme.bg,
+                fg=self.theme.accent2,
+                anchor="w",
+            ).grid(row=0, column=2 * i + 1, sticky="nsew", pady=5, padx=5)
 
         # Progress bar
         self.progress = ctk.Progressbar(
@@ -527,14 +536,29 @@ class StatusPanel(tk.Frame):
         )
         self.progress.grid(row=1, column=0, columnspan=8, sticky="nsew", pady=5, padx=5)
 
+        # Setter of each field, looked up once instead of on every update
+        self._setters = tuple(
+            (var_name, state_attr, getattr(self, var_name).set)
+            for _, var_name, state_attr in self.FIELDS
+        )
+        self._set_progress = self.progress.set
+
     def update_state(self, state: ExperimentState):
         """Update display from experiment state.
 
+        Only values that changed since the last update are set, as setting a
+        variable redraws its widget even when the value is the same.
+
         Args:
             state: Current experiment state
         """
-        self.current_step_var.set(state.current_step)
-        self.current_slice_var.set(str(state.current_slice))
-        self.slice_time_var.set(state.avg_slice_time_str)
-        self.time_left_var.set(state.remaining_time_str)
-        self.progress.set(state.progress_percent)
+        shown = self._shown
+        for var_name, state_attr, set_value in self._setters:
+            value = str(getattr(state, state_attr))
+            if shown.get(var_name) != value:
+                set_value(value)
+                shown[var_name] = value
+
+        if shown.get("progress") != state.progress_percent:
+            self._set_progress(state.progress_percent)
+            shown["progress"] = state.progress_percent
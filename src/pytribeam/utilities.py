@@ -99,7 +99,6 @@ from pathlib import Path
 from typing import Dict, Tuple, Any, List
 from enum import Enum
 import platform
-import pytest
 from functools import singledispatch
 import shutil
 
@@ -107,7 +106,6 @@ import shutil
 import yaml
 import contextlib
 import sys
-from pandas import json_normalize
 
 # # # 3rd party module
 # from schema import Schema, And, Use, Optional, SchemaError
@@ -493,6 +491,9 @@ def _flatten(dictionary: dict) -> dict:
     dict
         The flattened dictionary.
     """
+    # pandas is slow to import and only needed here
+    from pandas import json_normalize
+
     data_frame = json_normalize(dictionary, sep="_")
     db_flat = data_frame.to_dict(orient="records")[0]
     return db_flat
@@ -47,7 +47,7 @@ run_experiment_cli(start_slice: int, start_step: int, yml_path: Path)
 # Default python modules
 # from functools import singledispatch
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from functools import singledispatch
 import subprocess
 
@@ -609,6 +609,7 @@ def pre_flight_check(yml_path: Path) -> tbt.ExperimentSettings:
 
 def setup_experiment(
     yml_path: Path,
+    experiment_settings: Optional[tbt.ExperimentSettings] = None,
 ) -> tbt.ExperimentSettings:
     """
     Set up the experiment based on the YAML configuration.
@@ -619,6 +620,8 @@ def setup_experiment(
     ----------
     yml_path : Path
         The path to the YAML configuration file.
+    experiment_settings : tbt.ExperimentSettings, optional
+        Settings already returned by `pre_flight_check` for this file. If given, the pre-flight check is not repeated.
 
     Returns
     -------
@@ -626,7 +629,8 @@ def setup_experiment(
         The experiment settings.
     """
     # validate yml
-    experiment_settings = pre_flight_check(yml_path=yml_path)
+    if experiment_settings is None:
+        experiment_settings = pre_flight_check(yml_path=yml_path)
 
     log_filepath = experiment_settings.general_settings.log_filepath
     log.create_file(log_filepath)
@@ -97,6 +97,10 @@ class TestAppResources:
         assert app_resources.logo_dark_path == dark_expected
         assert app_resources.logo_light_path == light_expected
 
+    def test_paths_are_computed_once(self, app_resources: AppResources):
+        assert app_resources.icon_path is app_resources.icon_path
+        assert app_resources.logo_dark_path.parent == app_resources.logos_dir
+
     # ------------------------------------------------------------------
     # get_logo_path()
     # ------------------------------------------------------------------
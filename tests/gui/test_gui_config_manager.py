@@ -84,6 +84,7 @@ class TestAppConfigFromEnv:
         assert cfg.auto_save_interval == 300
         assert cfg.recent_configs == []
         assert cfg.max_recent_files == 10
+        assert cfg.max_terminal_lines == 10000
 
 
 class TestAppConfigFileIO:
@@ -98,6 +99,7 @@ class TestAppConfigFileIO:
             auto_save_interval=60,
             recent_configs=["a.cfg", "b.cfg"],
             max_recent_files=5,
+            max_terminal_lines=500,
         )
 
         # Save to file
@@ -174,3 +176,9 @@ class TestAppConfigLogPaths:
         # Both should be located inside the log_dir
         assert term_path.parent == cfg.log_dir
         assert err_path.parent == cfg.log_dir
+
+    def test_log_paths_create_log_dir(self, tmp_path):
+        cfg = AppConfig(data_dir=tmp_path / "data", log_dir=tmp_path / "logs")
+        err_path = cfg.get_error_log_path()
+        assert err_path.parent.is_dir()
+        assert not cfg.data_dir.exists()
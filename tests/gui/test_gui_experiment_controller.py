@@ -4,11 +4,13 @@ and :class:`pytribeam.GUI.runner_util.experiment_controller.ExperimentState`.
 """
 
 import datetime
+import threading
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 import pytest
 
+from pytribeam.GUI.common import StoppableThread
 from pytribeam.GUI.runner_util.experiment_controller import (
     ExperimentController,
     ExperimentState,
@@ -234,6 +236,75 @@ class TestValidateConfig:
         # Old settings reference should have been replaced by validate_config flow
         # (clear is called before, so no crash)
 
+    def test_reuses_validated_settings(self, monkeypatch, tmp_path):
+        path = tmp_path / "config.yml"
+        path.write_text("general: {}\n")
+        fake_settings = MagicMock()
+        calls = []
+        monkeypatch.setattr(
+            "pytribeam.GUI.runner_util.experiment_controller.workflow.setup_experiment",
+            lambda p, experiment_settings=None: (
+                calls.append(experiment_settings) or fake_settings
+            ),
+        )
+
+        ctrl = ExperimentController(config_path=path)
+        ctrl.set_validated_settings(fake_settings)
+        ok, settings, err = ctrl.validate_config()
+        assert ok is True
+        assert settings is fake_settings
+        assert calls == [fake_settings]
+        # Settings are only reused once
+        ctrl.validate_config()
+        assert calls == [fake_settings, None]
+
+    def test_changed_file_is_validated_again(self, monkeypatch, tmp_path):
+        path = tmp_path / "config.yml"
+        path.write_text("general: {}\n")
+        calls = []
+        monkeypatch.setattr(
+            "pytribeam.GUI.runner_util.experiment_controller.workflow.setup_experiment",
+            lambda p, experiment_settings=None: (
+                calls.append(experiment_settings) or MagicMock()
+            ),
+        )
+
+        ctrl = ExperimentController(config_path=path)
+        validated = MagicMock()
+        validated.microscope = None
+        ctrl.set_validated_settings(validated)
+        path.write_text("general: {}\nsteps: {}\n")
+        ctrl.validate_config()
+        assert calls == [None]
+
+    def test_validated_settings_ignored_while_running(self, monkeypatch, tmp_path):
+        path = tmp_path / "config.yml"
+        path.write_text("general: {}\n")
+        disconnect_calls = []
+        monkeypatch.setattr(
+            "pytribeam.GUI.runner_util.experiment_controller.utilities.disconnect_microscope",
+            lambda m, **kw: disconnect_calls.append(m),
+        )
+
+        ctrl = ExperimentController(config_path=path)
+        running = MagicMock()
+        ctrl.experiment_settings = running
+        ctrl.state.is_running = True
+        ctrl.set_validated_settings(MagicMock())
+        assert ctrl.experiment_settings is running
+        assert ctrl._validated_key is None
+        assert disconnect_calls == []
+
+    def test_clear_forgets_validated_settings(self, tmp_path):
+        path = tmp_path / "config.yml"
+        path.write_text("general: {}\n")
+        ctrl = ExperimentController(config_path=path)
+        validated = MagicMock()
+        validated.microscope = None
+        ctrl.set_validated_settings(validated)
+        ctrl.clear_experiment_settings()
+        assert ctrl._validated_key is None
+
 
 # ----------------------------------------------------------------------
 # Stop requests (while not running)
@@ -299,8 +370,52 @@ class TestStopRequests:
         )
         ctrl.request_stop_now()
         assert ctrl.state.should_stop_now is True
+        assert ctrl.stop_event.is_set()
         assert received["kind"] == "now"
 
+    def test_request_stop_now_lets_thread_stop_on_its_own(self, monkeypatch):
+        monkeypatch.setattr(
+            "pytribeam.GUI.runner_util.experiment_controller.generate_escape_keypress",
+            lambda: None,
+        )
+        ctrl = ExperimentController()
+        ctrl.state.is_running = True
+        ctrl._thread = StoppableThread(target=ctrl.stop_event.wait, args=(5,))
+        interrupts = []
+        monkeypatch.setattr(
+            ctrl._thread, "raise_exception", lambda exc: interrupts.append(exc)
+        )
+        ctrl._thread.start()
+
+        ctrl.request_stop_now()
+        ctrl._thread.join(1)
+
+        assert not ctrl._thread.is_alive()
+        assert interrupts == []
+
+    def test_request_stop_now_interrupts_after_grace_period(self, monkeypatch):
+        monkeypatch.setattr(
+            "pytribeam.GUI.runner_util.experiment_controller.generate_escape_keypress",
+            lambda: None,
+        )
+        ctrl = ExperimentController()
+        ctrl.HARD_STOP_GRACE_S = 0.05
+        ctrl.state.is_running = True
+        release = threading.Event()
+        ctrl._thread = StoppableThread(target=release.wait, args=(5,))
+        interrupted = threading.Event()
+
+        def fake_raise(exc):
+            interrupted.set()
+            release.set()
+
+        monkeypatch.setattr(ctrl._thread, "raise_exception", fake_raise)
+        ctrl._thread.start()
+
+        ctrl.request_stop_now()
+
+        assert interrupted.wait(2)
+
 
 # ----------------------------------------------------------------------
 # _update_progress
@@ -331,6 +446,12 @@ class TestUpdateProgress:
         # (1-1)*4 + 1 = 1 / 20 * 100 = 5%
         assert ctrl.state.progress_percent == 5
 
+    def test_progress_is_exact_integer_percent(self):
+        ctrl = ExperimentController()
+        # 29 / 100 * 100 is 28.999... in floating point
+        ctrl._update_progress(slice_num=1, step_num=29, total_slices=1, total_steps=100)
+        assert ctrl.state.progress_percent == 29
+
     def test_state_changed_callback_fired(self):
         ctrl = ExperimentController()
         fired = []
@@ -338,6 +459,17 @@ class TestUpdateProgress:
         ctrl._update_progress(1, 1, 5, 5)
         assert fired
 
+    def test_unchanged_percent_not_notified(self):
+        ctrl = ExperimentController()
+        fired = []
+        ctrl.register_callback("state_changed", lambda s: fired.append(True))
+        # 1/1000 and 2/1000 both round down to 0%
+        ctrl._update_progress(1, 1, 10, 100)
+        ctrl._update_progress(1, 2, 10, 100)
+        assert fired == []
+        ctrl._update_progress(1, 10, 10, 100)
+        assert fired == [True]
+
 
 # ----------------------------------------------------------------------
 # _update_timing_stats
@@ -345,13 +477,15 @@ class TestUpdateProgress:
 class TestUpdateTimingStats:
     def test_no_slice_times_is_no_op(self):
         ctrl = ExperimentController()
-        ctrl._slice_times = []
+        ctrl._slice_time_total = 0.0
+        ctrl._slice_count = 0
         ctrl._update_timing_stats(1, 10)
         assert ctrl.state.avg_slice_time_str == "-"
 
     def test_computes_average_and_remaining(self):
         ctrl = ExperimentController()
-        ctrl._slice_times = [60.0, 60.0]  # 1 min each
+        ctrl._slice_time_total = 120.0  # 2 slices of 1 min
+        ctrl._slice_count = 2
 
         ctrl._update_timing_stats(current_slice=2, total_slices=5)
 
@@ -361,16 +495,38 @@ class TestUpdateTimingStats:
 
     def test_fires_state_changed_callback(self):
         ctrl = ExperimentController()
-        ctrl._slice_times = [30.0]
+        ctrl._slice_time_total = 30.0
+        ctrl._slice_count = 1
         fired = []
         ctrl.register_callback("state_changed", lambda s: fired.append(True))
 
         ctrl._update_timing_stats(1, 5)
         assert fired
 
+    def test_unchanged_times_not_notified(self):
+        ctrl = ExperimentController()
+        ctrl._slice_time_total = 30.0
+        ctrl._slice_count = 1
+        fired = []
+        ctrl.register_callback("state_changed", lambda s: fired.append(True))
+
+        ctrl._update_timing_stats(1, 5)
+        ctrl._update_timing_stats(1, 5)
+        assert fired == [True]
+
+    def test_times_longer_than_a_day(self):
+        ctrl = ExperimentController()
+        ctrl._slice_time_total = 3725.0
+        ctrl._slice_count = 1
+        ctrl._update_timing_stats(current_slice=1, total_slices=25)
+        assert ctrl.state.avg_slice_time_str == "1:02:05"
+        # 24 * 3725 s, in hours rather than days
+        assert ctrl.state.remaining_time_str == "24:50:00"
+
     def test_zero_remaining_slices(self):
         ctrl = ExperimentController()
-        ctrl._slice_times = [120.0]
+        ctrl._slice_time_total = 120.0
+        ctrl._slice_count = 1
         ctrl._update_timing_stats(current_slice=5, total_slices=5)
         # remaining_slices = 5 - 5 = 0, so remaining_time = 0
         assert ctrl.state.remaining_time_str == str(datetime.timedelta(seconds=0))
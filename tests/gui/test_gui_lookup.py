@@ -1,7 +1,7 @@
 import pytest
 from copy import deepcopy
 
-from pytribeam.GUI.config_ui.lookup import LUT, LUTField, VersionedLUT
+from pytribeam.GUI.config_ui.lookup import LUT, LUTField, VersionedLUT, _make_field
 
 
 # ----------------------------------------------------------------------
@@ -58,6 +58,30 @@ class TestLUTBasics:
         lut["a"] = field_int
         assert lut["a"] == field_int
 
+    def test_extend(self, field_int, field_bool):
+        lut = LUT("test")
+        lut.extend((("a", field_int), ("b", field_bool)))
+        assert list(lut.keys()) == ["a", "b"]
+        assert lut["b"] == field_bool
+
+    def test_add_entry_rejects_duplicates(self, field_int, field_bool):
+        lut = LUT("test")
+        lut.add_entry("a", field_int)
+        with pytest.raises(ValueError):
+            lut.add_entry("a", field_bool)
+        with pytest.raises(ValueError):
+            lut.extend((("b", field_int), ("b", field_bool)))
+        with pytest.raises(ValueError):
+            lut.extend((("a", field_bool),))
+        assert list(lut.keys()) == ["a"]
+        assert lut["a"] is field_int
+
+    def test_item_assignment_replaces(self, field_int, field_bool):
+        lut = LUT("test")
+        lut["a"] = field_int
+        lut["a"] = field_bool
+        assert lut["a"] is field_bool
+
     def test_remove_entry(self, field_int):
         lut = LUT()
         lut["a"] = field_int
@@ -72,11 +96,84 @@ class TestLUTBasics:
         copy = deepcopy(nested_lut)
         assert nested_lut == copy
 
+    def test_deepcopy_shares_fields(self, nested_lut, field_int):
+        copy = deepcopy(nested_lut)
+
+        assert copy == nested_lut
+        assert copy["beam"] is not nested_lut["beam"]
+        assert copy["beam"]["voltage"] is field_int
+
+    def test_equality_with_itself_and_flattened_copy(self, nested_lut):
+        assert nested_lut == nested_lut
+        flat = deepcopy(nested_lut)
+        flat.flatten()
+        assert len(flat.keys()) != len(nested_lut.keys())
+        assert flat == nested_lut
+
+    def test_equality_after_nested_change(self, nested_lut, field_int):
+        copy = deepcopy(nested_lut)
+        assert nested_lut == copy
+
+        copy["beam"]["current"] = field_int
+        assert nested_lut != copy
+
+        nested_lut["beam"]["current"] = field_int
+        assert nested_lut == copy
+
+    def test_clone_copies_structure_and_shares_fields(self, nested_lut, field_int):
+        clone = nested_lut.clone()
+        assert clone == nested_lut
+        assert clone["beam"] is not nested_lut["beam"]
+        assert clone["beam"]["voltage"] is nested_lut["beam"]["voltage"]
+
+        clone["beam"].remove_entry("voltage")
+        assert "voltage" in nested_lut["beam"].keys()
+
 
 # ----------------------------------------------------------------------
 # Flattening
 # ----------------------------------------------------------------------
 class TestFlattening:
+    def test_set_path_leaves_shared_luts_unchanged(self, field_int, field_bool):
+        shared = LUT("shared")
+        shared["a"] = field_int
+        first = LUT("first")
+        first["child"] = shared
+        second = LUT("second")
+        second["child"] = shared
+
+        first.set_path(("child", "a"), field_bool)
+
+        assert first["child"]["a"] is field_bool
+        assert second["child"]["a"] is field_int
+        assert shared["a"] is field_int
+
+    def test_iter_leaves_matches_flatten(self, nested_lut):
+        leaves = list(nested_lut.iter_leaves())
+        flat = nested_lut._flatten()
+
+        assert ["/".join(path) for path, _ in leaves] == list(flat)
+        assert [field for _, field in leaves] == list(flat.values())
+
+    def test_remove_leaf(self, nested_lut, field_int):
+        removed = nested_lut.remove_leaf(("beam", "voltage"))
+
+        assert removed is field_int
+        assert list(nested_lut["beam"].keys()) == ["enabled"]
+
+    def test_view_is_read_only(self, nested_lut, field_int):
+        view = nested_lut.view()
+        flat_view = nested_lut.view(flat=True)
+
+        assert list(view) == ["beam"]
+        assert list(flat_view) == ["beam/voltage", "beam/enabled"]
+        with pytest.raises(TypeError):
+            flat_view["beam/voltage"] = field_int
+        # Taking a flat view leaves the LUT nested
+        assert list(nested_lut.keys()) == ["beam"]
+        with pytest.raises(TypeError):
+            nested_lut.entries["other"] = field_int
+
     def test_flatten_produces_paths(self, nested_lut):
         nested_lut.flatten()
         keys = nested_lut.entries.keys()
@@ -96,6 +193,79 @@ class TestFlattening:
         nested_lut.unflatten()
         assert nested_lut == original
 
+    def test_flatten_preserves_order(self, field_int, field_bool):
+        root = LUT("root")
+        stage = LUT("stage")
+        position = LUT("position")
+        position["x"] = field_int
+        stage["rotation"] = field_bool
+        stage["position"] = position
+        stage["tilt"] = field_int
+        root["name"] = field_bool
+        root["stage"] = stage
+        root["frequency"] = field_int
+
+        root.flatten()
+        assert list(root.keys()) == [
+            "name",
+            "stage/rotation",
+            "stage/position/x",
+            "stage/tilt",
+            "frequency",
+        ]
+
+        root.unflatten()
+        assert list(root.keys()) == ["name", "stage", "frequency"]
+        assert list(root["stage"].keys()) == ["rotation", "position", "tilt"]
+        assert list(root["stage"]["position"].keys()) == ["x"]
+
+
+# ----------------------------------------------------------------------
+# Field creation
+# ----------------------------------------------------------------------
+class TestMakeField:
+    def test_identical_fields_are_shared(self):
+        args = ("Voltage", "", DummyWidget, {"dtype": float}, "kV", float, (1.0, 1.0))
+        first = _make_field(*args)
+        second = _make_field(*args)
+        assert first is second
+        assert first == LUTField(*args)
+
+    def test_strings_shared_between_fields(self):
+        label = "".join(["Step ", "Name"])
+        first = _make_field(label, "a", DummyWidget, {}, "help", str, (1, 1))
+        second = _make_field("Step Name", "b", DummyWidget, {}, "help", str, (1, 1))
+        assert first.label is second.label
+        assert first.help_text is second.help_text
+
+    def test_kwargs_shared_between_fields(self):
+        first = _make_field("A", "", DummyWidget, {"dtype": int}, "a", int, (1, 1))
+        second = _make_field("B", "", DummyWidget, {"dtype": int}, "b", int, (1, 1))
+        assert first is not second
+        assert first.widget_kwargs is second.widget_kwargs
+        assert first.version is second.version
+
+    def test_widget_cls_returns_class_as_is(self, field_int):
+        assert field_int.widget_cls is DummyWidget
+
+    def test_widget_name_kept_as_string(self):
+        field = _make_field("A", "", "Entry", {}, "help", str, (1.0, 1.0))
+        assert field.widget == "Entry"
+
+    def test_kwargs_are_read_only(self):
+        field = _make_field(
+            "D", "X", DummyWidget, {"options": ["X", "Y"]}, "d", str, (1, 1)
+        )
+        assert field.widget_kwargs["options"] == ("X", "Y")
+        with pytest.raises(TypeError):
+            field.widget_kwargs["options"] = ["Z"]
+
+    def test_equal_values_of_different_types_not_merged(self):
+        flag = _make_field("C", False, DummyWidget, {}, "c", bool, (1, 1))
+        count = _make_field("C", 0, DummyWidget, {}, "c", bool, (1, 1))
+        assert flag is not count
+        assert count.default == 0 and type(count.default) is int
+
 
 # ----------------------------------------------------------------------
 # Dict-like behavior
@@ -123,6 +293,12 @@ def always_false(version, interval, mode):
 
 
 class TestVersionedLUT:
+    def test_module_luts_are_read_only(self):
+        from pytribeam.GUI.config_ui import lookup
+
+        with pytest.raises(TypeError):
+            lookup.LUTs["image"] = LUT("x")
+
     def test_invalid_version(self, monkeypatch):
         monkeypatch.setattr("pytribeam.GUI.config_ui.lookup.VERSIONS", [1])
         monkeypatch.setattr("pytribeam.GUI.config_ui.lookup.LUTs", {"image": LUT("x")})
@@ -255,3 +431,50 @@ class TestVersionedLUT:
 
         # Entire structure should disappear
         assert filtered.entries == {}
+
+    def test_repeated_calls_return_independent_copies(self, monkeypatch, field_int):
+        lut = LUT("image")
+        lut["a"] = field_int
+        calls = []
+
+        def counting_interval(version, interval, mode):
+            calls.append(version)
+            return True
+
+        monkeypatch.setattr("pytribeam.GUI.config_ui.lookup.VERSIONS", [1])
+        monkeypatch.setattr("pytribeam.GUI.config_ui.lookup.LUTs", {"image": lut})
+        monkeypatch.setattr(
+            "pytribeam.GUI.config_ui.lookup.ut.in_interval", counting_interval
+        )
+
+        vlut = VersionedLUT()
+        first = vlut.get_lut("image", 1)
+        first.remove_entry("a")
+        second = vlut.get_lut("image", 1)
+
+        assert "a" in second.entries
+        assert first is not second
+        assert len(calls) == 1
+
+    def test_each_version_limit_checked_once(self, monkeypatch, field_int, field_bool):
+        lut = LUT("image")
+        lut["a"] = field_int
+        lut["b"] = field_bool
+        lut["c"] = field_bool._replace(version=(11, 20))
+        calls = []
+
+        def counting_interval(version, interval, mode):
+            calls.append(interval)
+            start, end = interval
+            return start <= version <= end
+
+        monkeypatch.setattr("pytribeam.GUI.config_ui.lookup.VERSIONS", [1])
+        monkeypatch.setattr("pytribeam.GUI.config_ui.lookup.LUTs", {"image": lut})
+        monkeypatch.setattr(
+            "pytribeam.GUI.config_ui.lookup.ut.in_interval", counting_interval
+        )
+
+        filtered = VersionedLUT().get_lut("image", 1)
+
+        assert list(filtered.entries) == ["a", "b"]
+        assert sorted(calls) == [(0, 10), (11, 20)]
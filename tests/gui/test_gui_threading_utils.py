@@ -66,6 +66,16 @@ class TestStoppableThread:
         with pytest.raises(threading.ThreadError):
             t._get_thread_id()
 
+    def test_get_thread_id_is_ident(self):
+        release = threading.Event()
+        t = StoppableThread(target=release.wait)
+        t.start()
+        try:
+            assert t._get_thread_id() == t.ident
+        finally:
+            release.set()
+            t.join()
+
     def test_raise_exception_type_validation(self, short_task):
         t = StoppableThread(target=short_task, args=(1, 1))
         t.start()
@@ -143,8 +153,11 @@ class DummyWidget:
         self.content = ""
         self.autoscroll = True
 
-    def after(self, delay, func, text):
-        func(text)
+    def after(self, delay, func, *args):
+        func(*args)
+
+    def after_idle(self, func, *args):
+        func(*args)
 
     def config(self, **kwargs):
         pass
@@ -179,6 +192,7 @@ class TestTextRedirector:
         r = TextRedirector(widget, log_path=str(log))
 
         r.write("abc")
+        r.flush()
         assert log.read_text().endswith("abc")
 
     def test_background_thread_write(self):
@@ -194,6 +208,94 @@ class TestTextRedirector:
 
         assert "thread" in widget.content
 
+    def test_background_writes_batched(self):
+        widget = DummyWidget()
+        scheduled = []
+        widget.after_idle = lambda func, *args: scheduled.append(func)
+        inserts = []
+        widget.insert = lambda pos, text, tag: inserts.append(text)
+        r = TextRedirector(widget)
+
+        def worker():
+            for i in range(3):
+                r.write(f"line {i}\n")
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+        assert len(scheduled) == 1
+        scheduled[0]()
+        assert inserts == ["line 0\nline 1\nline 2\n"]
+
+    def test_main_thread_write_keeps_order(self):
+        widget = DummyWidget()
+        widget.after_idle = lambda func, *args: None  # never runs on its own
+        r = TextRedirector(widget)
+
+        t = threading.Thread(target=r.write, args=("first ",))
+        t.start()
+        t.join()
+        r.write("second")
+
+        assert widget.content == "first second"
+
+    def test_main_thread_write_joins_queued_text(self):
+        widget = DummyWidget()
+        widget.after_idle = lambda func, *args: None  # never runs on its own
+        inserts = []
+        widget.insert = lambda pos, text, tag: inserts.append(text)
+        r = TextRedirector(widget)
+
+        t = threading.Thread(target=r.write, args=("first ",))
+        t.start()
+        t.join()
+        r.write("second")
+
+        assert inserts == ["first second"]
+
+    def test_log_file_opened_once(self, monkeypatch, tmp_path):
+        import os
+
+        log = tmp_path / "out.log"
+        r = TextRedirector(DummyWidget(), log_path=str(log))
+        opened = []
+        real_open = os.open
+
+        def counting_open(path, *a, **k):
+            opened.append(path)
+            return real_open(path, *a, **k)
+
+        monkeypatch.setattr(os, "open", counting_open)
+        r.write("a")
+        r.write("b")
+        r.flush()
+        assert opened == [str(log)]
+        monkeypatch.undo()
+        assert log.read_text().endswith("ab")  # written without closing
+
+        r.close()
+        assert r._log_fd is None
+
+    def test_max_lines_trims_oldest(self):
+        widget = DummyWidget()
+
+        def index(pos):
+            return f"{widget.content.count(chr(10)) + 1}.0"
+
+        def delete(start, end):
+            n_lines = int(end.split(".")[0]) - 1
+            widget.content = widget.content.split("\n", n_lines)[-1]
+
+        widget.index = index
+        widget.delete = delete
+        r = TextRedirector(widget, max_lines=3)
+
+        for i in range(5):
+            r.write(f"line {i}\n")
+
+        assert widget.content == "line 2\nline 3\nline 4\n"
+
     def test_file_write_error_ignored(self, monkeypatch, tmp_path):
         widget = DummyWidget()
         log = tmp_path / "out.log"
@@ -202,8 +304,31 @@ class TestTextRedirector:
         def fail_open(*a, **k):
             raise OSError
 
-        monkeypatch.setattr("builtins.open", fail_open)
+        monkeypatch.setattr("os.open", fail_open)
         r.write("safe")  # should not crash
+        r.flush()
+
+    def test_close_writes_pending_text(self, tmp_path):
+        log = tmp_path / "out.log"
+        r = TextRedirector(DummyWidget(), log_path=str(log))
+
+        for i in range(100):
+            r.write(f"line {i}\n")
+        r.close()
+
+        assert log.read_text().endswith("line 98\nline 99\n")
+        assert r._log_thread is None
+
+    def test_write_and_flush_after_close(self, tmp_path):
+        log = tmp_path / "out.log"
+        r = TextRedirector(DummyWidget(), log_path=str(log))
+        r.write("before\n")
+        r.close()
+
+        r.write("after\n")  # should not raise
+        r.flush()  # should return without waiting
+        r.close()
+        assert not log.read_text().endswith("after\n")
 
 
 # ----------------------------------------------------------------------